@@ -0,0 +1,64 @@
+import argparse
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPEATS = 10
+PROMPT = b"Enter your choice"
+# What importing the module used to do before the menu could appear:
+# import matplotlib.pyplot and read the CSV.
+EAGER = "import worldbank_visualizer as w\n{pyplot}w.get_data()\nw.main()\n"
+LAZY = "import worldbank_visualizer as w\nw.main()\n"
+
+
+def time_to_prompt(code: str) -> float:
+    """Start a visualizer process and return the seconds until the menu prompt."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", code],
+        cwd=here,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    output = b""
+    while PROMPT not in output:
+        chunk = process.stdout.read1(4096)
+        if not chunk:
+            raise RuntimeError("The visualizer exited before showing the menu.")
+        output += chunk
+    elapsed = time.perf_counter() - start
+    process.communicate(b"3\n")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark time to the first menu")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    args = parser.parse_args()
+
+    has_matplotlib = importlib.util.find_spec("matplotlib") is not None
+    if not has_matplotlib:
+        print("matplotlib is not installed; the eager run only reads the CSV.")
+    eager = EAGER.format(
+        pyplot="w.get_pyplot()\n" if has_matplotlib else "",
+    )
+
+    # Alternate the variants so both see the same machine load.
+    runs = {"eager (before)": [], "lazy (after)": []}
+    for _ in range(args.repeats):
+        runs["eager (before)"].append(time_to_prompt(eager))
+        runs["lazy (after)"].append(time_to_prompt(LAZY))
+    results = {}
+    for name, times in runs.items():
+        results[name] = statistics.median(times)
+        print(f"{name:>15}: median {results[name] * 1e3:7.1f} ms")
+    before, after = results.values()
+    print(f"{'speedup':>15}: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 import csv
-import matplotlib.pyplot as plt
+from functools import cache
 
 
 def load_data_from_csv(filepath: str = "countries_data.csv"):
@@ -23,12 +23,27 @@ def load_data_from_csv(filepath: str = "countries_data.csv"):
     return years, data
 
 
-years, data = load_data_from_csv()
-ukraine_data = list(data["Ukraine"].values())
-usa_data = list(data["USA"].values())
+@cache
+def get_data(filepath: str = "countries_data.csv"):
+    # Read on the first plot request and reused afterwards, so importing
+    # the module or showing the menu does no file I/O.
+    return load_data_from_csv(filepath)
+
+
+def get_pyplot():
+    # matplotlib is the slowest import here; only the plotting path pays
+    # for it.
+    import matplotlib.pyplot as plt
+
+    return plt
 
 
 def plot_line_graphs():
+    years, data = get_data()
+    ukraine_data = list(data["Ukraine"].values())
+    usa_data = list(data["USA"].values())
+
+    plt = get_pyplot()
     plt.figure(figsize=(12, 6))
     plt.plot(
         years,
@@ -66,6 +81,7 @@ def plot_line_graphs():
 
 
 def plot_bar_chart(country_name: str) -> None:
+    _, data = get_data()
     if country_name not in data:
         print(f"Error: Data for '{country_name}' not found.")
         print(f"Available countries: {', '.join(data.keys())}")
@@ -76,6 +92,7 @@ def plot_bar_chart(country_name: str) -> None:
 
     bar_color = "green" if country_name.lower() == "usa" else "red"
 
+    plt = get_pyplot()
     plt.figure(figsize=(12, 6))
     plt.bar(
         country_years,
@@ -0,0 +1,79 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from height_roster import HeightRoster
+from students_manager import SAMPLE_STUDENTS
+
+
+def place_students(students: HeightRoster, new_heights) -> pd.DataFrame:
+    """
+    Answer tasks a, b and c of process_new_student for many heights at once.
+
+    The roster heights are put into one sorted array and every new
+    height is located in it with a single vectorized searchsorted call,
+    so the cost is O((n + m) log n) for m new students instead of m
+    scans of the roster.
+
+    Args:
+        students: roster of existing students
+        new_heights: heights of the new students (any 1-d array-like)
+
+    Returns:
+        table with one row per new height and the columns:
+        height; valid (positive and not a duplicate, as required by
+        process_new_student); shorter_count (a: the shorter students are
+        the first shorter_count surnames of students.by_height());
+        insert_after (b); closest and closest_diff (c)
+    """
+    if not students:
+        raise ValueError("No students.")
+    pairs = students.by_height()
+    surnames = np.array([surname for surname, _ in pairs], dtype=object)
+    heights = np.array([data["height"] for _, data in pairs], dtype=float)
+    new_heights = np.asarray(new_heights, dtype=float)
+
+    shorter = np.searchsorted(heights, new_heights, side="left")
+    # Tallest shorter student, or the shortest one if nobody is shorter.
+    insert_after = surnames[np.maximum(shorter - 1, 0)]
+
+    below = np.maximum(shorter - 1, 0)
+    above = np.minimum(shorter, len(heights) - 1)
+    below_diff = np.abs(heights[below] - new_heights)
+    above_diff = np.abs(heights[above] - new_heights)
+    # On a tie the shorter student wins, as in HeightRoster.closest.
+    closest = np.where(below_diff <= above_diff, below, above)
+
+    duplicate = (shorter < len(heights)) & (heights[above] == new_heights)
+    return pd.DataFrame(
+        {
+            "height": new_heights,
+            "valid": (new_heights > 0) & ~duplicate,
+            "shorter_count": shorter,
+            "insert_after": insert_after,
+            "closest": surnames[closest],
+            "closest_diff": np.minimum(below_diff, above_diff).round(2),
+        }
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Place many new students into the sample roster by height"
+    )
+    parser.add_argument("heights", help="text file with one height (cm) per line")
+    parser.add_argument("--output", help="CSV file for the results (default stdout)")
+    args = parser.parse_args()
+
+    try:
+        new_heights = np.loadtxt(args.heights, dtype=float, ndmin=1)
+    except (OSError, ValueError) as e:
+        print(f"Error reading '{args.heights}': {e}")
+    else:
+        table = place_students(HeightRoster(SAMPLE_STUDENTS), new_heights)
+        if args.output:
+            table.to_csv(args.output, index=False)
+            print(f"Placed {len(table)} students, results in '{args.output}'.")
+        else:
+            print(table.to_csv(index=False), end="")
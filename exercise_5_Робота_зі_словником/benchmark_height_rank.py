@@ -0,0 +1,116 @@
+import random
+import timeit
+
+from height_rank import HeightRankTree
+from height_roster import HeightRoster
+
+ROSTER_SIZES = [1_000, 10_000, 100_000]
+REPEATS = 20
+
+
+def make_students(size: int) -> dict:
+    """
+    Build a synthetic students dictionary.
+
+    Half the heights are on a 0.1 cm grid and half are off it, as typed
+    heights like 170.04 are.
+    """
+    rng = random.Random(42)
+    return {
+        f"Student{i}": {
+            "height": rng.randint(1400, 2100) / 10
+            if i % 2
+            else round(rng.uniform(140, 210), 2),
+            "age": None,
+        }
+        for i in range(size)
+    }
+
+
+def scan_count_shorter(students: dict, height: float) -> int:
+    """Count shorter students with a list comprehension, as in students_manager."""
+    return len(
+        [surname for surname, data in students.items() if data["height"] < height]
+    )
+
+
+def scan_count_between(students: dict, low: float, high: float) -> int:
+    return len(
+        [surname for surname, data in students.items() if low <= data["height"] <= high]
+    )
+
+
+def scan_kth_tallest(students: dict, k: int) -> float:
+    return sorted((data["height"] for data in students.values()), reverse=True)[k - 1]
+
+
+def roster_add_remove(roster: HeightRoster, height: float) -> None:
+    """Add and remove a student in the sorted list index of HeightRoster."""
+    roster["New"] = {"height": height, "age": None}
+    del roster["New"]
+
+
+def tree_add_remove(tree: HeightRankTree, height: float) -> None:
+    tree.add(height)
+    tree.remove(height)
+
+
+def benchmark_roster(size: int) -> None:
+    students = make_students(size)
+    roster = HeightRoster(students)
+    tree = HeightRankTree.from_students(students)
+    k = size // 3
+
+    for height in (175.0, 170.04, 172.35):
+        assert scan_count_shorter(students, height) == roster.count_shorter(height)
+        assert roster.count_shorter(height) == len(roster.shorter_than(height))
+    for low, high in ((160.0, 180.0), (170.01, 170.03), (165.55, 165.56)):
+        assert scan_count_between(students, low, high) == roster.count_between(
+            low, high
+        )
+    for rank in (1, k, size):
+        assert scan_kth_tallest(students, rank) == tree.kth_tallest(rank)
+
+    cases = [
+        (
+            "count shorter",
+            lambda: scan_count_shorter(students, 175.0),
+            lambda: roster.count_shorter(175.0),
+        ),
+        (
+            "count between",
+            lambda: scan_count_between(students, 160.0, 180.0),
+            lambda: roster.count_between(160.0, 180.0),
+        ),
+        (
+            "k-th tallest",
+            lambda: scan_kth_tallest(students, k),
+            lambda: tree.kth_tallest(k),
+        ),
+        (
+            "add + remove",
+            lambda: roster_add_remove(roster, 172.3),
+            lambda: tree_add_remove(tree, 172.3),
+        ),
+    ]
+    for name, scan, indexed in cases:
+        scan_time = timeit.timeit(scan, number=REPEATS) / REPEATS
+        tree_time = timeit.timeit(indexed, number=REPEATS) / REPEATS
+        print(
+            f"{size:>10} | {name:<14} | {scan_time * 1e6:>10.1f} us | "
+            f"{tree_time * 1e6:>10.1f} us | {scan_time / tree_time:.1f}x"
+        )
+
+
+def main():
+    print(
+        f"{'students':>10} | {'operation':<14} | "
+        f"{'baseline':>13} | {'Fenwick tree':>13} | speedup"
+    )
+    print("-" * 72)
+    for size in ROSTER_SIZES:
+        benchmark_roster(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Mapping
+
+
+class HeightRankTree:
+    """
+    Counts of students per height in a Fenwick (binary indexed) tree.
+
+    Heights are coordinate-compressed: the tree is indexed by the rank of
+    each distinct height in a sorted list, and queries find their bounds
+    in that list with an exact bisect, so heights off any grid (170.04
+    from ``float(input())``) are counted exactly. Adding or removing a
+    student with a height already in the list and every query cost
+    O(log m), where m is the number of distinct heights, independent of
+    the number of students. A new distinct height is inserted into the
+    list and the tree is rebuilt in O(m). Heights whose count drops to
+    zero stay in the list until they make up half of it.
+
+    Args:
+        heights: heights of the initial students
+    """
+
+    def __init__(self, heights: Iterable[float] = ()) -> None:
+        self._heights: list[float] = []
+        self._counts: list[int] = []
+        self._count = 0
+        self._empty = 0  # distinct heights whose count is zero
+        for height in sorted(heights):
+            if self._heights and self._heights[-1] == height:
+                self._counts[-1] += 1
+            else:
+                self._heights.append(height)
+                self._counts.append(1)
+            self._count += 1
+        self._rebuild()
+
+    @classmethod
+    def from_students(cls, students: Mapping[str, dict]) -> "HeightRankTree":
+        """Build a tree from a students dictionary (surname -> {"height", ...})."""
+        return cls(data["height"] for data in students.values())
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _rebuild(self) -> None:
+        # 1-based Fenwick array; _tree[i] holds the sum of a range ending
+        # at i. Built in O(m) by pushing each node into its parent.
+        size = len(self._counts)
+        self._tree = [0] + self._counts
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                self._tree[parent] += self._tree[i]
+
+    def _compact(self) -> None:
+        kept = [(h, c) for h, c in zip(self._heights, self._counts) if c]
+        self._heights = [h for h, _ in kept]
+        self._counts = [c for _, c in kept]
+        self._empty = 0
+        self._rebuild()
+
+    def _update(self, rank: int, delta: int) -> None:
+        self._counts[rank] += delta
+        i = rank + 1
+        size = len(self._counts)
+        while i <= size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, end: int) -> int:
+        # Number of students in ranks [0, end).
+        total = 0
+        i = end
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def add(self, height: float) -> None:
+        """Add a student of the given height."""
+        rank = bisect_left(self._heights, height)
+        if rank < len(self._heights) and self._heights[rank] == height:
+            if not self._counts[rank]:
+                self._empty -= 1
+            self._update(rank, 1)
+        else:
+            self._heights.insert(rank, height)
+            self._counts.insert(rank, 1)
+            self._rebuild()
+        self._count += 1
+
+    def remove(self, height: float) -> None:
+        """Remove a student of the given height."""
+        rank = bisect_left(self._heights, height)
+        if (
+            rank == len(self._heights)
+            or self._heights[rank] != height
+            or not self._counts[rank]
+        ):
+            raise KeyError(height)
+        self._update(rank, -1)
+        self._count -= 1
+        if not self._counts[rank]:
+            self._empty += 1
+            if 2 * self._empty > len(self._heights):
+                self._compact()
+
+    def count_shorter(self, height: float) -> int:
+        """Return the number of students shorter than height."""
+        return self._prefix(bisect_left(self._heights, height))
+
+    def count_between(self, low: float, high: float) -> int:
+        """Return the number of students with low <= height <= high."""
+        if high < low:
+            return 0
+        return self._prefix(bisect_right(self._heights, high)) - self._prefix(
+            bisect_left(self._heights, low)
+        )
+
+    def kth_tallest(self, k: int) -> float:
+        """
+        Return the height of the k-th tallest student (k = 1 is the tallest).
+
+        Args:
+            k: rank from the top, 1 <= k <= number of students
+        """
+        if not 1 <= k <= self._count:
+            raise IndexError("k is out of range.")
+        # Walk down the tree to the rank holding the (count - k + 1)-th
+        # shortest student.
+        size = len(self._counts)
+        remaining = self._count - k + 1
+        position = 0
+        bit = 1 << size.bit_length()
+        while bit:
+            nxt = position + bit
+            if nxt <= size and self._tree[nxt] < remaining:
+                position = nxt
+                remaining -= self._tree[nxt]
+            bit >>= 1
+        return self._heights[position]
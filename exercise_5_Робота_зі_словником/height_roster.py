@@ -0,0 +1,143 @@
+from bisect import bisect_left, insort
+from collections.abc import Iterator, MutableMapping
+
+from height_rank import HeightRankTree
+
+
+class HeightRoster(MutableMapping):
+    """
+    Dictionary of students (surname -> {"height", "age"}) with a height index.
+
+    Behaves like the plain ``students`` dictionary, but keeps a list of
+    (height, surname) pairs sorted by height and a count of students per
+    height in sync on every insert and removal. Duplicate checks are a
+    hash lookup, and "shorter than", insertion point and closest height
+    queries are a binary search instead of a scan or a full sort. Rank
+    counts go through a HeightRankTree, so they cost O(log m) and never
+    build a list.
+
+    Args:
+        students: initial dictionary with student data
+    """
+
+    def __init__(self, students: dict | None = None) -> None:
+        self._students: dict[str, dict] = {}
+        # Ascending (height, surname); ties are ordered by surname.
+        self._by_height: list[tuple[float, str]] = []
+        self._height_counts: dict[float, int] = {}
+        self._ranks = HeightRankTree()
+        if students:
+            # Bulk load: one sort, and the rank tree is built once
+            # instead of growing one distinct height at a time.
+            self._students = dict(students)
+            self._by_height = sorted(
+                (data["height"], surname) for surname, data in self._students.items()
+            )
+            for height, _ in self._by_height:
+                self._height_counts[height] = self._height_counts.get(height, 0) + 1
+            self._ranks = HeightRankTree(height for height, _ in self._by_height)
+
+    def __getitem__(self, surname: str) -> dict:
+        return self._students[surname]
+
+    def __setitem__(self, surname: str, data: dict) -> None:
+        if surname in self._students:
+            self._unindex(surname, self._students[surname]["height"])
+        self._students[surname] = data
+        self._ranks.add(data["height"])
+        insort(self._by_height, (data["height"], surname))
+        self._height_counts[data["height"]] = (
+            self._height_counts.get(data["height"], 0) + 1
+        )
+
+    def __delitem__(self, surname: str) -> None:
+        data = self._students.pop(surname)
+        self._unindex(surname, data["height"])
+
+    def __contains__(self, surname: object) -> bool:
+        return surname in self._students
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._students)
+
+    def __len__(self) -> int:
+        return len(self._students)
+
+    def _unindex(self, surname: str, height: float) -> None:
+        del self._by_height[bisect_left(self._by_height, (height, surname))]
+        self._ranks.remove(height)
+        self._height_counts[height] -= 1
+        if not self._height_counts[height]:
+            del self._height_counts[height]
+
+    def has_height(self, height: float) -> bool:
+        """Return True if a student with exactly this height exists."""
+        return height in self._height_counts
+
+    def by_height(self, descending: bool = False) -> list[tuple[str, dict]]:
+        """
+        Return (surname, data) pairs ordered by height.
+
+        Args:
+            descending: tallest first instead of shortest first
+        """
+        pairs = reversed(self._by_height) if descending else self._by_height
+        return [(surname, self._students[surname]) for _, surname in pairs]
+
+    def shorter_than(self, height: float) -> list[str]:
+        """
+        Return surnames of students shorter than height, shortest first.
+
+        Args:
+            height: height to compare with
+        """
+        end = bisect_left(self._by_height, (height,))
+        return [surname for _, surname in self._by_height[:end]]
+
+    def tallest_shorter_than(self, height: float) -> str | None:
+        """
+        Return the surname of the tallest student shorter than height.
+
+        Args:
+            height: height to compare with
+        """
+        end = bisect_left(self._by_height, (height,))
+        return self._by_height[end - 1][1] if end else None
+
+    def count_shorter(self, height: float) -> int:
+        """
+        Return the number of students shorter than height.
+
+        Args:
+            height: height to compare with
+        """
+        return self._ranks.count_shorter(height)
+
+    def count_between(self, low: float, high: float) -> int:
+        """
+        Return the number of students with low <= height <= high.
+
+        Args:
+            low: smallest height to count
+            high: largest height to count
+        """
+        return self._ranks.count_between(low, high)
+
+    def shortest(self) -> str | None:
+        """Return the surname of the shortest student."""
+        return self._by_height[0][1] if self._by_height else None
+
+    def closest(self, height: float) -> str | None:
+        """
+        Return the surname of the student whose height is closest to height.
+
+        On a tie the shorter student is returned.
+
+        Args:
+            height: height to compare with
+        """
+        i = bisect_left(self._by_height, (height,))
+        neighbors = self._by_height[max(0, i - 1) : i + 1]
+        if not neighbors:
+            return None
+        return min(neighbors, key=lambda pair: abs(pair[0] - height))[1]
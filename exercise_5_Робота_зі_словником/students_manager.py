@@ -1,20 +1,35 @@
-def print_all_values(students: dict) -> None:
+from height_roster import HeightRoster
+
+MAX_HEIGHT = 300.0
+
+SAMPLE_STUDENTS = {
+    "Petrov": {"height": 185.5, "age": 17},
+    "Ivanov": {"height": 182.0, "age": 16},
+    "Sidorov": {"height": 180.0, "age": 17},
+    "Kozlov": {"height": 178.5, "age": 16},
+    "Volkov": {"height": 175.0, "age": 17},
+    "Sokolov": {"height": 173.5, "age": 16},
+    "Lebedev": {"height": 171.0, "age": 17},
+    "Orlov": {"height": 169.5, "age": 16},
+    "Volnov": {"height": 167.0, "age": 17},
+    "Medvedev": {"height": 165.0, "age": 16},
+}
+
+
+def print_all_values(students: HeightRoster) -> None:
     """Print all values from the students dictionary."""
     if not students:
         print("No students in the class.")
         return
 
-    sorted_students = sorted(
-        students.items(), key=lambda x: x[1]["height"], reverse=True
-    )
-    for surname, data in sorted_students:
+    for surname, data in students.by_height(descending=True):
         print(
             f"{surname}: {data['height']} cm"
             + (f", age {data['age']}" if data.get("age") else "")
         )
 
 
-def add_entry(students: dict) -> None:
+def add_entry(students: HeightRoster) -> None:
     """Add a new student to the dictionary with error handling."""
     try:
         surname = input("Enter student surname: ").strip()
@@ -23,7 +38,7 @@ def add_entry(students: dict) -> None:
             return
 
         height = float(input("Enter student height (cm): "))
-        if height <= 0 or height in [data["height"] for data in students.values()]:
+        if not 0 < height <= MAX_HEIGHT or students.has_height(height):
             print("Error: Invalid or duplicate height.")
             return
 
@@ -34,7 +49,7 @@ def add_entry(students: dict) -> None:
         print("Error: Invalid input.")
 
 
-def remove_entry(students: dict) -> None:
+def remove_entry(students: HeightRoster) -> None:
     """Remove a student from the dictionary with error handling."""
     if not students:
         print("No students.")
@@ -49,7 +64,7 @@ def remove_entry(students: dict) -> None:
     print(f"Removed: {surname}")
 
 
-def print_sorted_by_keys(students: dict) -> None:
+def print_sorted_by_keys(students: HeightRoster) -> None:
     """Print dictionary content sorted by keys (surnames)."""
     if not students:
         print("No students.")
@@ -63,42 +78,27 @@ def print_sorted_by_keys(students: dict) -> None:
         )
 
 
-def find_students_shorter_than(students: dict, new_height: float) -> list[str]:
+def find_students_shorter_than(students: HeightRoster, new_height: float) -> list[str]:
     """
     Find surnames of all students whose height is less than the new student's height.
     """
-    shorter_students = [
-        surname for surname, data in students.items() if data["height"] < new_height
-    ]
-    return shorter_students
+    return students.shorter_than(new_height)
 
 
-def find_insertion_point(students: dict, new_height: float) -> str:
+def find_insertion_point(students: HeightRoster, new_height: float) -> str:
     """
     Find the surname of the student after which the new student should be inserted
     to maintain descending order.
     """
-    sorted_students = sorted(
-        students.items(), key=lambda x: x[1]["height"], reverse=True
-    )
+    return students.tallest_shorter_than(new_height) or students.shortest() or ""
 
-    for surname, data in sorted_students:
-        if data["height"] < new_height:
-            return surname
 
-    return sorted_students[-1][0] if sorted_students else ""
-
-
-def find_closest_height(students: dict, new_height: float) -> str:
+def find_closest_height(students: HeightRoster, new_height: float) -> str:
     """Find the surname of the student whose height differs least from the new student's height."""
-    return (
-        min(students.items(), key=lambda x: abs(x[1]["height"] - new_height))[0]
-        if students
-        else ""
-    )
+    return students.closest(new_height) or ""
 
 
-def process_new_student(students: dict) -> None:
+def process_new_student(students: HeightRoster) -> None:
     """Process tasks for a new student."""
     if not students:
         print("No students.")
@@ -111,9 +111,7 @@ def process_new_student(students: dict) -> None:
             return
 
         new_height = float(input("Enter new student's height (cm): "))
-        heights = [data["height"] for data in students.values()]
-
-        if new_height <= 0 or new_height in heights:
+        if not 0 < new_height <= MAX_HEIGHT or students.has_height(new_height):
             print("Error: Invalid or duplicate height.")
             return
 
@@ -122,7 +120,8 @@ def process_new_student(students: dict) -> None:
         closest_student = find_closest_height(students, new_height)
 
         print(
-            f"\na) Shorter students: {', '.join(shorter_students) if shorter_students else 'None'}"
+            f"\na) Shorter students ({students.count_shorter(new_height)}): "
+            f"{', '.join(shorter_students) if shorter_students else 'None'}"
         )
         print(f"b) Insert after: {insertion_point}")
         print(
@@ -140,7 +139,7 @@ def process_new_student(students: dict) -> None:
         print("Error: Invalid input.")
 
 
-def main_menu(students: dict) -> None:
+def main_menu(students: HeightRoster) -> None:
     """
     Display main menu and handle user interactions.
     """
@@ -176,17 +175,5 @@ def main_menu(students: dict) -> None:
 
 
 if __name__ == "__main__":
-    students = {
-        "Petrov": {"height": 185.5, "age": 17},
-        "Ivanov": {"height": 182.0, "age": 16},
-        "Sidorov": {"height": 180.0, "age": 17},
-        "Kozlov": {"height": 178.5, "age": 16},
-        "Volkov": {"height": 175.0, "age": 17},
-        "Sokolov": {"height": 173.5, "age": 16},
-        "Lebedev": {"height": 171.0, "age": 17},
-        "Orlov": {"height": 169.5, "age": 16},
-        "Volnov": {"height": 167.0, "age": 17},
-        "Medvedev": {"height": 165.0, "age": 16},
-    }
-
+    students = HeightRoster(SAMPLE_STUDENTS)
     main_menu(students)
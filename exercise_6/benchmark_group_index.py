@@ -0,0 +1,87 @@
+import random
+import timeit
+
+from student_store import StudentStore
+
+ROSTER_SIZES = [10_000, 100_000, 500_000]
+GROUP_COUNT = 500
+REPEATS = 20
+
+
+def make_roster(size: int, group_count: int = GROUP_COUNT) -> dict:
+    """Build a synthetic students dictionary of the given size."""
+    rng = random.Random(42)
+    students = {}
+    for i in range(size):
+        subjects = {
+            "Mathematics": rng.randint(50, 100),
+            "Programming": rng.randint(50, 100),
+            "Physics": rng.randint(50, 100),
+        }
+        students[f"Student{i}"] = {
+            "group": f"IP-{i % group_count}",
+            "full_name": {
+                "surname": f"Student{i}",
+                "first_name": "Name",
+                "patronymic": "Patronymic",
+            },
+            "course": i % 6 + 1,
+            "subjects": subjects,
+            "average": round(sum(subjects.values()) / len(subjects), 2),
+        }
+    return students
+
+
+def scan_group(students: dict, group: str) -> list[tuple[str, dict]]:
+    """Full-scan group lookup, as done before the group index."""
+    return [
+        (surname, data) for surname, data in students.items() if data["group"] == group
+    ]
+
+
+def scan_group_average(students: dict, group: str) -> float:
+    """Full-scan group average, as done before the group index."""
+    averages = [data["average"] for data in students.values() if data["group"] == group]
+    return sum(averages) / len(averages)
+
+
+def benchmark_roster(size: int) -> None:
+    students = make_roster(size)
+    store = StudentStore(students)
+    group = "IP-7"
+
+    assert scan_group(students, group) == store.find_by_group(group)
+
+    cases = [
+        (
+            "find group",
+            lambda: scan_group(students, group),
+            lambda: store.find_by_group(group),
+        ),
+        (
+            "group average",
+            lambda: scan_group_average(students, group),
+            lambda: store.group_average(group),
+        ),
+    ]
+    for name, scan, indexed in cases:
+        scan_time = timeit.timeit(scan, number=REPEATS) / REPEATS
+        index_time = timeit.timeit(indexed, number=REPEATS) / REPEATS
+        print(
+            f"{size:>10} | {name:<14} | {scan_time * 1e3:>9.3f} ms | "
+            f"{index_time * 1e3:>9.3f} ms | {scan_time / index_time:.0f}x"
+        )
+
+
+def main():
+    print(
+        f"{'students':>10} | {'operation':<14} | "
+        f"{'full scan':>12} | {'index':>12} | speedup"
+    )
+    print("-" * 70)
+    for size in ROSTER_SIZES:
+        benchmark_roster(size)
+
+
+if __name__ == "__main__":
+    main()
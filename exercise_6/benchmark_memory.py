@@ -0,0 +1,63 @@
+import gc
+import json
+import tracemalloc
+
+from benchmark_group_index import make_roster
+from compact_store import CompactStudentStore
+from student_store import StudentStore
+
+ROSTER_SIZES = [10_000, 100_000]
+
+
+def iter_decoded(students: dict):
+    """Yield records decoded from JSON text, as they are when loaded from a file."""
+    for surname, data in students.items():
+        yield json.loads(json.dumps(surname)), json.loads(json.dumps(data))
+
+
+def measure(build) -> int:
+    """Return the number of bytes still allocated by the object build() returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def build_store(store_class, students: dict, search: bool = False):
+    store = store_class()
+    store.extend(iter_decoded(students))
+    if search:
+        # The surname index is only built by the first search.
+        store.search_prefix("")
+    return store
+
+
+def report_roster(size: int) -> None:
+    students = make_roster(size)
+    cases = [
+        ("dict", lambda: dict(iter_decoded(students))),
+        ("StudentStore", lambda: build_store(StudentStore, students)),
+        ("CompactStudentStore", lambda: build_store(CompactStudentStore, students)),
+        (
+            "+ surname index",
+            lambda: build_store(CompactStudentStore, students, search=True),
+        ),
+    ]
+    for name, build in cases:
+        used = measure(build)
+        print(f"{size:>10} | {name:<20} | {used / 2**20:>7.1f} MB | {used / size:.0f}")
+
+
+def main():
+    print(f"{'students':>10} | {'representation':<20} | {'total':>10} | bytes/student")
+    print("-" * 64)
+    for size in ROSTER_SIZES:
+        report_roster(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import time
+
+from benchmark_group_index import GROUP_COUNT, make_roster
+from records_server import RecordsServer
+from student_store import StudentStore
+
+DEFAULT_PORT = 8766
+
+
+def run_server(size: int, port: int, ready) -> None:
+    """Serve a synthetic roster of the given size until terminated."""
+
+    async def main():
+        server = RecordsServer(StudentStore(make_roster(size)))
+        listener = await server.start("127.0.0.1", port)
+        ready.set()
+        async with listener:
+            await listener.serve_forever()
+
+    asyncio.run(main())
+
+
+def make_request(rng: random.Random, size: int, client: int, write_ratio: float):
+    """Return a random request: mostly reads, some adds and removes."""
+    if rng.random() < write_ratio:
+        surname = f"Load{client}-{rng.randrange(100)}"
+        if rng.random() < 0.5:
+            return {"op": "remove", "surname": surname}
+        return {
+            "op": "add",
+            "surname": surname,
+            "group": f"IP-{rng.randrange(GROUP_COUNT)}",
+            "first_name": "Name",
+            "course": rng.randint(1, 6),
+            "subjects": {"Mathematics": rng.randint(50, 100)},
+        }
+    kind = rng.random()
+    if kind < 0.4:
+        return {"op": "get", "surname": f"Student{rng.randrange(size)}"}
+    if kind < 0.6:
+        return {"op": "group_average", "group": f"IP-{rng.randrange(GROUP_COUNT)}"}
+    if kind < 0.75:
+        return {"op": "find_group", "group": f"IP-{rng.randrange(GROUP_COUNT)}"}
+    if kind < 0.9:
+        offset = rng.randrange(size)
+        return {"op": "sorted", "by": "average", "offset": offset, "limit": 20}
+    return {"op": "search", "query": f"Studnt{rng.randrange(size)}"}
+
+
+async def run_client(
+    host: str, port: int, client: int, count: int, size: int, write_ratio: float
+) -> list[float]:
+    """Send count requests one after another and return their latencies."""
+    rng = random.Random(client)
+    reader, writer = await asyncio.open_connection(host, port, limit=2**24)
+    latencies = []
+    for i in range(count):
+        request = make_request(rng, size, client, write_ratio)
+        request["id"] = i
+        start = time.perf_counter()
+        writer.write(json.dumps(request).encode() + b"\n")
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        assert response["id"] == i
+    writer.close()
+    return latencies
+
+
+async def load_test(args) -> None:
+    per_client = args.requests // args.clients
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            run_client(
+                args.host, args.port, client, per_client, args.size, args.write_ratio
+            )
+            for client in range(args.clients)
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for result in results for latency in result)
+    print(
+        f"{len(latencies)} requests from {args.clients} clients "
+        f"({args.write_ratio:.0%} writes) against {args.size:,} students"
+    )
+    print(f"throughput: {len(latencies) / elapsed:,.0f} requests/s")
+    print(
+        f"latency: median {latencies[len(latencies) // 2] * 1e3:.2f} ms, "
+        f"p99 {latencies[len(latencies) * 99 // 100] * 1e3:.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for records_server")
+    parser.add_argument("--size", type=int, default=100_000, help="roster size")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--write-ratio", type=float, default=0.05)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--external",
+        action="store_true",
+        help="test a server that is already running instead of starting one "
+        "(reads then assume its roster has Student0..Student<size-1>)",
+    )
+    args = parser.parse_args()
+
+    server = None
+    if not args.external:
+        ready = multiprocessing.Event()
+        server = multiprocessing.Process(
+            target=run_server, args=(args.size, args.port, ready), daemon=True
+        )
+        server.start()
+        ready.wait()
+    try:
+        asyncio.run(load_test(args))
+    finally:
+        if server is not None:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import gc
+import random
+import statistics
+import time
+
+from surname_index import SurnameIndex
+
+SURNAME_COUNT = 1_000_000
+QUERY_COUNT = 1_000
+ONSETS = ["b", "v", "h", "d", "zh", "z", "k", "l", "m", "n", "p", "r", "s", "t"]
+ONSETS += ["f", "kh", "ts", "ch", "sh", "hr", "kr", "pr", "st", "tr", "sk", "br"]
+VOWELS = ["a", "e", "i", "o", "u", "y"]
+CODAS = ["", "", "n", "l", "r", "s", "k", "m", "v"]
+ENDINGS = ["enko", "chuk", "ko", "yk", "iv", "ov", "ych", "uk", "ak", "ets", "skyi"]
+
+
+def make_surnames(count: int) -> list[str]:
+    """Build unique synthetic surnames from random syllables and common endings."""
+    rng = random.Random(42)
+    syllables = [o + v + c for o in ONSETS for v in VOWELS for c in CODAS]
+    surnames = set()
+    while len(surnames) < count:
+        stem = "".join(rng.choices(syllables, k=rng.randint(1, 3)))
+        surnames.add((stem + rng.choice(ENDINGS)).capitalize())
+    return list(surnames)
+
+
+def misspell(surname: str, rng: random.Random) -> str:
+    """Replace one letter of a surname."""
+    i = rng.randrange(len(surname))
+    return surname[:i] + rng.choice("aeiouxyz") + surname[i + 1 :]
+
+
+def timed(query, argument: str) -> float:
+    """Return the duration of one query in microseconds."""
+    start = time.perf_counter()
+    query(argument)
+    return (time.perf_counter() - start) * 1e6
+
+
+def main():
+    surnames = make_surnames(SURNAME_COUNT)
+    index = SurnameIndex()
+    for surname in surnames:
+        index.add(surname, ordered=False)
+    index.sort()
+    # Keep full collections of the million-surname heap out of the timings.
+    gc.freeze()
+
+    rng = random.Random(7)
+    sample = rng.sample(surnames, QUERY_COUNT)
+    prefixes = [surname[: rng.randint(3, 6)] for surname in sample]
+    typos = [misspell(surname, rng) for surname in sample]
+
+    prefix_times = [timed(index.prefix, prefix) for prefix in prefixes]
+    fuzzy_times = [timed(index.fuzzy, typo) for typo in typos]
+    found = sum(
+        surname in [match for match, _ in index.fuzzy(typo)]
+        for surname, typo in zip(sample, typos)
+    )
+
+    print(f"{SURNAME_COUNT:,} surnames, {QUERY_COUNT} queries")
+    for name, times in [("prefix", prefix_times), ("fuzzy", fuzzy_times)]:
+        times.sort()
+        print(
+            f"{name:<6}: mean {statistics.mean(times):.1f} us, "
+            f"median {times[len(times) // 2]:.1f} us, "
+            f"p99 {times[len(times) * 99 // 100]:.1f} us"
+        )
+    print(f"fuzzy recall (original in top 10): {found / QUERY_COUNT:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+import argparse
+import csv
+import json
+import os
+import time
+from collections.abc import Iterator
+from itertools import islice
+
+import pandas as pd
+
+from compact_store import CompactStudentStore
+from records_journal import RecordsJournal
+from student_store import StudentStore
+
+DEFAULT_BATCH_SIZE = 100_000
+NAME_COLUMNS = ["surname", "group", "first_name", "patronymic"]
+BASE_COLUMNS = NAME_COLUMNS + ["course"]
+# Subject columns are namespaced so that a subject named like a base
+# column (say "course") cannot clash with it.
+SUBJECT_PREFIX = "subject:"
+
+
+def _subject_columns(columns) -> dict:
+    return {column: SUBJECT_PREFIX + str(column) for column in columns}
+
+
+def read_csv_batches(path: str, batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Read a students CSV file in batches.
+
+    The file has the columns surname, group, first_name, patronymic,
+    course; every other column is a subject holding the grade, or an
+    empty cell if the student has no grade for it.
+
+    Args:
+        path: path to the CSV file
+        batch_size: number of rows per batch
+    """
+    for batch in pd.read_csv(
+        path,
+        chunksize=batch_size,
+        dtype={column: str for column in NAME_COLUMNS},
+        keep_default_na=False,
+        na_values=[""],
+    ):
+        subjects = [column for column in batch.columns if column not in BASE_COLUMNS]
+        yield batch.rename(columns=_subject_columns(subjects))
+
+
+def read_jsonl_batches(path: str, batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Read a students JSON Lines file in batches.
+
+    Every line is an object with surname, group, first_name, patronymic,
+    course and a "subjects" object of subject -> grade. Lines that are
+    not valid JSON objects get an "_error" value and are rejected.
+
+    Args:
+        path: path to the JSON Lines file
+        batch_size: number of lines per batch
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        while lines := list(islice(f, batch_size)):
+            rows, subjects = [], []
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                    if not isinstance(entry, dict):
+                        raise ValueError
+                    grades = entry.get("subjects") or {}
+                    if not isinstance(grades, dict):
+                        raise ValueError
+                except ValueError:
+                    entry, grades = {"_error": "Invalid JSON line."}, {}
+                rows.append(entry)
+                subjects.append(grades)
+            batch = pd.DataFrame.from_records(rows, columns=BASE_COLUMNS + ["_error"])
+            grades = pd.DataFrame.from_records(subjects)
+            grades = grades.rename(columns=_subject_columns(grades.columns))
+            yield pd.concat([batch, grades], axis=1)
+
+
+def validate_batch(batch: pd.DataFrame, store: StudentStore) -> tuple[list, list]:
+    """
+    Validate a batch with the same rules as add_student.
+
+    Checks are done column-wise over the whole batch and the averages
+    are computed in one vectorized pass.
+
+    Args:
+        batch: rows with base columns and one SUBJECT_PREFIX column per
+            subject, as produced by the read_*_batches functions
+        store: store the rows will be added to (for duplicate surnames)
+
+    Returns:
+        (surname, record) pairs of valid rows and (row, surname, reason)
+        tuples of rejected rows, where row is the position in the batch
+    """
+    batch = batch.reset_index(drop=True)
+    for column in BASE_COLUMNS + ["_error"]:
+        if column not in batch:
+            batch[column] = None
+    names = {
+        column: batch[column].where(batch[column].notna(), "").astype(str).str.strip()
+        for column in NAME_COLUMNS
+    }
+    surnames = names["surname"]
+    course = pd.to_numeric(batch["course"], errors="coerce")
+    subject_columns = [
+        column for column in batch.columns if str(column).startswith(SUBJECT_PREFIX)
+    ]
+    raw_grades = batch[subject_columns]
+    subject_names = [column[len(SUBJECT_PREFIX) :] for column in subject_columns]
+    grades = raw_grades.apply(pd.to_numeric, errors="coerce").astype(float)
+
+    in_store = pd.Series([surname in store for surname in surnames.tolist()])
+    # Later checks override earlier ones, so the first rule in add_student wins.
+    checks = [
+        (
+            grades.notna().sum(axis=1) == 0,
+            "At least one subject with grade must be entered.",
+        ),
+        (
+            ((grades < 0) | (grades > 100)).any(axis=1),
+            "Grade must be between 0 and 100.",
+        ),
+        ((raw_grades.notna() & grades.isna()).any(axis=1), "Enter a valid grade."),
+        (course.isna() | (course % 1 != 0), "Invalid course."),
+        ((course < 1) | (course > 6), "Course must be between 1 and 6."),
+        (names["first_name"] == "", "First name cannot be empty."),
+        (names["group"] == "", "Group number cannot be empty."),
+        (in_store, "Student with this surname already exists."),
+        (surnames == "", "Surname cannot be empty."),
+        (batch["_error"].notna(), "Invalid JSON line."),
+    ]
+    reasons = pd.Series(None, index=batch.index, dtype=object)
+    for mask, reason in checks:
+        reasons[mask.to_numpy()] = reason
+
+    # Repeated surnames within the batch: the first valid row wins.
+    repeated = surnames[reasons.isna()].duplicated()
+    reasons[repeated[repeated].index] = "Student with this surname already exists."
+
+    valid = reasons.isna().to_numpy()
+    averages = grades[valid].mean(axis=1).round(2)
+    valid_grades = grades[valid].to_numpy().tolist()
+
+    records = []
+    for surname, group, first_name, patronymic, course_value, average, row in zip(
+        surnames[valid].tolist(),
+        names["group"][valid].tolist(),
+        names["first_name"][valid].tolist(),
+        names["patronymic"][valid].tolist(),
+        course[valid].astype(int).tolist(),
+        averages.tolist(),
+        valid_grades,
+    ):
+        subjects = {
+            subject: grade
+            for subject, grade in zip(subject_names, row)
+            if grade == grade  # skip NaN
+        }
+        records.append(
+            (
+                surname,
+                {
+                    "group": group,
+                    "full_name": {
+                        "surname": surname,
+                        "first_name": first_name,
+                        "patronymic": patronymic,
+                    },
+                    "course": course_value,
+                    "subjects": subjects,
+                    "average": average,
+                },
+            )
+        )
+
+    rejected = [
+        (row, surnames[row], reasons[row]) for row in batch.index[~valid].tolist()
+    ]
+    return records, rejected
+
+
+def import_students(
+    store: StudentStore,
+    path: str,
+    error_path: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> tuple[int, int]:
+    """
+    Import students from a CSV or JSON Lines (.jsonl) file into a store.
+
+    Rows are validated in batches; valid rows are added with one
+    StudentStore.extend call per batch and rejected rows are written
+    to an error report (CSV with line, surname and reason).
+
+    Args:
+        store: store to add the students to
+        path: path to the .csv or .jsonl file
+        error_path: path of the error report, <path>.errors.csv if None
+        batch_size: number of rows validated at a time
+
+    Returns:
+        (number of imported rows, number of rejected rows)
+    """
+    if path.endswith((".jsonl", ".ndjson")):
+        batches, first_line = read_jsonl_batches(path, batch_size), 1
+    else:
+        batches, first_line = read_csv_batches(path, batch_size), 2
+
+    error_path = error_path or path + ".errors.csv"
+    imported = rejected = 0
+    with open(error_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["line", "surname", "reason"])
+        for batch in batches:
+            records, errors = validate_batch(batch, store)
+            store.extend(records)
+            writer.writerows(
+                (first_line + row, surname, reason) for row, surname, reason in errors
+            )
+            imported += len(records)
+            rejected += len(errors)
+            first_line += len(batch)
+
+    return imported, rejected
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Import students and grades from CSV or JSON Lines files"
+    )
+    parser.add_argument("files", nargs="+", help=".csv or .jsonl files to import")
+    parser.add_argument("--errors", help="error report path (single input file)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--compact", action="store_true")
+    args = parser.parse_args()
+    if args.errors and len(args.files) > 1:
+        parser.error("--errors can only be used with a single input file")
+
+    json_file = os.path.join(os.path.dirname(__file__), "students_data.json")
+    journal = RecordsJournal(json_file)
+    students = journal.load(
+        store_class=CompactStudentStore if args.compact else StudentStore
+    )
+    # Logging every imported row would cost a JSON line each and keep
+    # rewriting the snapshot; the import is saved with one snapshot at
+    # the end instead.
+    students.journal = None
+    try:
+        for path in args.files:
+            start = time.perf_counter()
+            try:
+                imported, rejected = import_students(
+                    students, path, args.errors, args.batch_size
+                )
+            except (OSError, ValueError) as e:
+                print(f"Error importing '{path}': {e}")
+                continue
+            elapsed = time.perf_counter() - start
+            print(
+                f"{path}: imported {imported}, rejected {rejected} "
+                f"in {elapsed:.1f} s ({(imported + rejected) / elapsed:,.0f} rows/s)"
+            )
+    finally:
+        journal.checkpoint()
+        journal.close()
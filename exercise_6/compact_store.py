@@ -0,0 +1,82 @@
+import sys
+from array import array
+
+from student_store import StudentStore
+
+
+class _CompactRecord:
+    """Student record without per-record dictionaries."""
+
+    __slots__ = (
+        "group",
+        "first_name",
+        "patronymic",
+        "course",
+        "average",
+        "subjects",
+        "grades",
+        "int_grades",
+    )
+
+
+class CompactStudentStore(StudentStore):
+    """
+    StudentStore that keeps records in a compact form.
+
+    Each record is a ``__slots__`` object instead of three nested
+    dictionaries. Group, name and subject strings are interned, the
+    tuple of subject names is shared by all students with the same
+    subjects, and grades are stored in a typed float array with a bit
+    mask of the grades that were ints. Records are turned back into the
+    usual dictionaries on access, so all menu operations behave the same
+    as with the plain store.
+
+    Args:
+        students: initial dictionary with student data
+        track_subjects: keep per-subject aggregates
+    """
+
+    def __init__(
+        self, students: dict | None = None, track_subjects: bool = True
+    ) -> None:
+        self._layouts: dict[tuple[str, ...], tuple[str, ...]] = {}
+        super().__init__(students, track_subjects)
+
+    def _pack(self, surname: str, data: dict) -> _CompactRecord:
+        full_name = data["full_name"]
+        subjects = data["subjects"]
+        names = tuple(sys.intern(subject) for subject in subjects)
+
+        record = _CompactRecord()
+        record.group = sys.intern(data["group"])
+        record.first_name = sys.intern(full_name["first_name"])
+        record.patronymic = sys.intern(full_name.get("patronymic", ""))
+        record.course = data["course"]
+        record.average = data["average"]
+        record.subjects = self._layouts.setdefault(names, names)
+        record.grades = array("d", subjects.values())
+        # Grades loaded from JSON are ints; bit i marks grade i as one, so
+        # mixed records such as {"Math": 85, "Phys": 90.5} round-trip.
+        record.int_grades = sum(
+            1 << i for i, grade in enumerate(subjects.values()) if type(grade) is int
+        )
+        return record
+
+    def _unpack(self, surname: str, packed: _CompactRecord) -> dict:
+        grades = packed.grades.tolist()
+        mask = packed.int_grades
+        if mask:
+            grades = [
+                int(grade) if mask >> i & 1 else grade for i, grade in enumerate(grades)
+            ]
+        return {
+            "group": packed.group,
+            "full_name": {
+                "surname": surname,
+                "first_name": packed.first_name,
+                "patronymic": packed.patronymic,
+            },
+            "course": packed.course,
+            "subjects": dict(zip(packed.subjects, grades)),
+            "average": packed.average,
+        }
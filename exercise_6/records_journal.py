@@ -0,0 +1,248 @@
+import json
+import os
+import threading
+from collections.abc import Callable, Mapping, MutableMapping
+
+from records_loader import iter_students
+from student_store import StudentStore
+
+DEFAULT_COMPACT_THRESHOLD = 4 * 1024 * 1024
+
+
+class RecordsJournal:
+    """
+    Write-ahead log of add/remove operations on a student store.
+
+    Every mutation is appended to ``<snapshot>.log`` as one JSON line,
+    so saving costs O(1) per operation instead of re-serializing the
+    whole dictionary. On startup the snapshot is loaded and the log is
+    replayed on top of it. When the log grows past the threshold it is
+    rotated to ``<snapshot>.log.old`` and a background thread writes a
+    new snapshot, after which the rotated log is deleted. If that
+    snapshot fails, the rotated log is kept, the next rotation retries
+    the snapshot instead of overwriting it, and the error is raised to
+    the caller. Operations are idempotent per surname, so replaying a
+    rotated log that is already part of the snapshot (after a crash)
+    gives the same state.
+
+    Args:
+        snapshot_path: path to the JSON snapshot (students_data.json)
+        compact_threshold: log size in bytes that triggers compaction
+        sync: call fsync after every append
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+        sync: bool = False,
+    ) -> None:
+        self.snapshot_path = snapshot_path
+        self.log_path = snapshot_path + ".log"
+        self.old_log_path = self.log_path + ".old"
+        self.compact_threshold = compact_threshold
+        self.sync = sync
+        self._lock = threading.Lock()
+        self._log = None
+        self._compaction: threading.Thread | None = None
+        self._compaction_error: Exception | None = None
+        self._store: StudentStore | None = None
+
+    def load(
+        self,
+        progress: Callable[[int, int, int], None] | None = None,
+        lazy: bool = False,
+        store_class: type[StudentStore] = StudentStore,
+    ) -> StudentStore:
+        """
+        Stream the snapshot, replay the logs and start journaling.
+
+        Args:
+            progress: loading progress callback, see iter_students
+            lazy: decode each record's subjects only on access; subject
+                statistics are not tracked in this mode
+            store_class: StudentStore or a subclass such as
+                CompactStudentStore
+
+        Returns:
+            store with the recovered student data
+        """
+        store = store_class(track_subjects=not lazy)
+        self.restore(store, progress, lazy)
+
+        if os.path.exists(self.old_log_path):
+            # A compaction was interrupted; finish it before the next
+            # rotation would overwrite the old log.
+            self._write_snapshot(store.snapshot())
+
+        self.attach(store)
+        return store
+
+    def restore(
+        self,
+        store: MutableMapping,
+        progress: Callable[[int, int, int], None] | None = None,
+        lazy: bool = False,
+    ) -> None:
+        """
+        Stream the snapshot and replay the logs into a store.
+
+        The store is not journaled; load() uses this before attach(),
+        and other backends use it to import the JSON data.
+
+        Args:
+            store: StudentStore or SqliteStudentStore
+            progress: loading progress callback, see iter_students
+            lazy: decode each record's subjects only on access
+        """
+        if os.path.exists(self.snapshot_path):
+            store.extend(iter_students(self.snapshot_path, progress, lazy))
+
+        for path in (self.old_log_path, self.log_path):
+            self._replay(path, store)
+
+    def attach(self, store: StudentStore) -> None:
+        """
+        Start journaling mutations of a store.
+
+        Args:
+            store: store whose mutations will be appended to the log
+        """
+        self._store = store
+        self._log = open(self.log_path, "a", encoding="utf-8")
+        store.journal = self
+
+    def record_add(self, surname: str, data: dict) -> None:
+        """Append an add (or replace) operation to the log."""
+        self._append({"op": "add", "surname": surname, "data": data})
+
+    def record_remove(self, surname: str) -> None:
+        """Append a remove operation to the log."""
+        self._append({"op": "remove", "surname": surname})
+
+    def compact(self) -> None:
+        """
+        Rotate the log and write a new snapshot in a background thread.
+
+        Does nothing if a previous compaction is still running.
+        """
+        with self._lock:
+            self._rotate()
+
+    def checkpoint(self) -> None:
+        """
+        Write a snapshot of the store now and start an empty log.
+
+        Used after a bulk change made with the journal detached
+        (``store.journal = None``), so the change costs one snapshot
+        write instead of one log line per record.
+        """
+        if self._compaction is not None:
+            self._compaction.join()
+        with self._lock:
+            self._write_snapshot(self._store.snapshot())
+            # The snapshot already holds everything in the log.
+            self._log.close()
+            self._log = open(self.log_path, "w", encoding="utf-8")
+
+    def close(self) -> None:
+        """
+        Wait for a running compaction and close the log.
+
+        Raises:
+            RuntimeError: the last compaction failed; the rotated log is
+                kept and replayed on the next load
+        """
+        if self._compaction is not None:
+            self._compaction.join()
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+        if self._store is not None:
+            self._store.journal = None
+        self._raise_compaction_error()
+
+    def _append(self, entry: dict) -> None:
+        line = json.dumps(entry, ensure_ascii=False, default=_encode_mapping) + "\n"
+        with self._lock:
+            # Rotate before writing: the entry is applied to the store
+            # only after it is logged, so it must go to the new log.
+            if self._log.tell() >= self.compact_threshold:
+                self._rotate()
+            self._log.write(line)
+            self._log.flush()
+            if self.sync:
+                os.fsync(self._log.fileno())
+
+    def _rotate(self) -> None:
+        # Called with the lock held.
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+
+        # Only a shallow copy of the records is taken here, under the
+        # caller's event loop or thread; decoding them into dictionaries
+        # is left to the snapshot thread.
+        students = self._store.snapshot()
+        if os.path.exists(self.old_log_path):
+            # The last compaction failed, so the rotated log still holds
+            # mutations missing from the snapshot. Retry the snapshot
+            # instead of rotating over it, and report the failure.
+            self._start_compaction(students)
+            self._raise_compaction_error()
+            return
+
+        self._log.close()
+        os.replace(self.log_path, self.old_log_path)
+        self._log = open(self.log_path, "a", encoding="utf-8")
+        self._start_compaction(students)
+
+    def _start_compaction(self, build: Callable[[], dict]) -> None:
+        self._compaction = threading.Thread(
+            target=self._compact_in_background, args=(build,), daemon=True
+        )
+        self._compaction.start()
+
+    def _compact_in_background(self, build: Callable[[], dict]) -> None:
+        try:
+            self._write_snapshot(build)
+        except Exception as e:
+            self._compaction_error = e
+
+    def _raise_compaction_error(self) -> None:
+        error, self._compaction_error = self._compaction_error, None
+        if error is not None:
+            raise RuntimeError(f"Snapshot compaction failed: {error}") from error
+
+    def _write_snapshot(self, build: Callable[[], dict]) -> None:
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(build(), f, indent=4, ensure_ascii=False, default=_encode_mapping)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        if os.path.exists(self.old_log_path):
+            os.remove(self.old_log_path)
+
+    @staticmethod
+    def _replay(path: str, store: MutableMapping) -> None:
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line after a crash.
+                    break
+                if entry["op"] == "add":
+                    store[entry["surname"]] = entry["data"]
+                elif entry["op"] == "remove":
+                    store.pop(entry["surname"], None)
+
+
+def _encode_mapping(obj):
+    # Lazily loaded subjects are mappings, not dicts.
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
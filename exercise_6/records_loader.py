@@ -0,0 +1,193 @@
+import codecs
+import json
+import os
+import re
+from collections.abc import Callable, Iterator, Mapping
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+PROGRESS_INTERVAL = 10_000
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# A string (group 1 is None if it is cut off by the end of the buffer)
+# or a single structural character.
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*(")?|[{}\[\]]')
+_decoder = json.JSONDecoder()
+
+
+class LazySubjects(Mapping):
+    """
+    Read-only ``subjects`` mapping decoded from JSON on first access.
+
+    Args:
+        raw: JSON text of the subjects object
+    """
+
+    __slots__ = ("_raw", "_data")
+
+    def __init__(self, raw: str) -> None:
+        self._raw = raw
+        self._data = None
+
+    def _load(self) -> dict:
+        if self._data is None:
+            self._data = json.loads(self._raw)
+            self._raw = None
+        return self._data
+
+    def __getitem__(self, subject: str) -> float:
+        return self._load()[subject]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
+class _ChunkReader:
+    """Decoded text buffer over a binary file, refilled on demand."""
+
+    def __init__(self, f, chunk_size: int) -> None:
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.bytes_read = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        self.bytes_read += len(chunk)
+        self.eof = not chunk
+        # Drop the consumed prefix so the buffer stays about one record long.
+        self.buffer = self.buffer[self.pos :] + self.decoder.decode(chunk, self.eof)
+        self.pos = 0
+        return True
+
+    def bytes_consumed(self) -> int:
+        return self.bytes_read - len(self.buffer[self.pos :].encode("utf-8"))
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise json.JSONDecodeError("Unexpected end of data", self.buffer, 0)
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def decode(self):
+        # Top-level keys and records are strings and objects, which fail to
+        # decode when cut off, so a failure means "read more".
+        self.peek()
+        while True:
+            try:
+                value, self.pos = _decoder.raw_decode(self.buffer, self.pos)
+                return value
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+
+    def decode_lazy_record(self) -> dict:
+        self.peek()
+        while True:
+            try:
+                record, self.pos = _decode_lazy_record(self.buffer, self.pos)
+                return record
+            except (json.JSONDecodeError, IndexError):
+                if not self.fill():
+                    raise
+
+
+def _scan_value_end(text: str, pos: int) -> int:
+    """Return the end of the object/array starting at pos without decoding it."""
+    depth = 0
+    for match in _TOKEN.finditer(text, pos):
+        token = match.group()
+        if token[0] == '"':
+            if match.group(1) is None:
+                break
+        elif token in "{[":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    raise json.JSONDecodeError("Unterminated value", text, pos)
+
+
+def _decode_lazy_record(text: str, pos: int) -> tuple[dict, int]:
+    """
+    Decode a record object, keeping its ``subjects`` as raw JSON text.
+
+    Raises JSONDecodeError or IndexError if the record is cut off by the
+    end of the text. A value that ends exactly at the end of the text may
+    be a cut-off number, so it is treated as incomplete too.
+    """
+    record = {}
+    if text[pos] != "{":
+        raise json.JSONDecodeError("Expecting '{'", text, pos)
+    pos = _WHITESPACE.match(text, pos + 1).end()
+    while text[pos] != "}":
+        key, pos = _decoder.raw_decode(text, pos)
+        pos = _WHITESPACE.match(text, pos).end()
+        if text[pos] != ":":
+            raise json.JSONDecodeError("Expecting ':'", text, pos)
+        pos = _WHITESPACE.match(text, pos + 1).end()
+        if key == "subjects":
+            end = _scan_value_end(text, pos)
+            record[key] = LazySubjects(text[pos:end])
+            pos = end
+        else:
+            record[key], pos = _decoder.raw_decode(text, pos)
+        pos = _WHITESPACE.match(text, pos).end()
+        if text[pos] == ",":
+            pos = _WHITESPACE.match(text, pos + 1).end()
+    return record, pos + 1
+
+
+def iter_students(
+    path: str,
+    progress: Callable[[int, int, int], None] | None = None,
+    lazy: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[str, dict]]:
+    """
+    Stream (surname, record) pairs from a students JSON file.
+
+    The file is read in chunks and decoded one student at a time, so
+    peak memory is one chunk plus one record instead of the whole text
+    and the whole nested dictionary.
+
+    Args:
+        path: path to the JSON file (object of surname -> record)
+        progress: called as progress(students, bytes_read, total_bytes)
+            every PROGRESS_INTERVAL students and once at the end
+        lazy: keep each record's ``subjects`` as raw JSON text that is
+            decoded only when it is accessed (see LazySubjects)
+        chunk_size: number of bytes read at a time
+    """
+    total = os.path.getsize(path)
+    count = 0
+    with open(path, "rb") as f:
+        reader = _ChunkReader(f, chunk_size)
+        reader.expect("{")
+        while reader.peek() != "}":
+            surname = reader.decode()
+            reader.expect(":")
+            record = reader.decode_lazy_record() if lazy else reader.decode()
+            yield surname, record
+            count += 1
+            if progress is not None and count % PROGRESS_INTERVAL == 0:
+                progress(count, reader.bytes_consumed(), total)
+            if reader.peek() == ",":
+                reader.pos += 1
+    if progress is not None:
+        progress(count, total, total)
@@ -0,0 +1,144 @@
+import io
+import json
+import sys
+from collections.abc import Iterable
+from typing import TextIO
+
+FORMATS = ["text", "tsv", "jsonl"]
+TSV_COLUMNS = [
+    "surname",
+    "first_name",
+    "patronymic",
+    "group",
+    "course",
+    "average",
+    "subjects",
+]
+DEFAULT_BUFFER_SIZE = 256 * 1024
+
+
+def _name(data: dict) -> str:
+    full_name = data["full_name"]
+    return f"{full_name['first_name']} {full_name.get('patronymic', '')}".strip()
+
+
+def _text_full(surname: str, data: dict) -> str:
+    subjects = ", ".join(f"{s}: {g}" for s, g in data["subjects"].items())
+    return (
+        f"{surname} {_name(data)} - Group: {data['group']}, "
+        f"Course: {data['course']}, Avg: {data['average']} | {subjects}\n"
+    )
+
+
+def _text_ranked(surname: str, data: dict) -> str:
+    return (
+        f"{surname} {_name(data)}: {data['average']} "
+        f"(group {data['group']}, course {data['course']})\n"
+    )
+
+
+def _text_sorted(surname: str, data: dict) -> str:
+    return (
+        f"{surname} {_name(data)} - Group: {data['group']}, "
+        f"Course: {data['course']}, Average: {data['average']}\n"
+    )
+
+
+TEXT_LAYOUTS = {"full": _text_full, "ranked": _text_ranked, "sorted": _text_sorted}
+
+
+def _tsv_field(value) -> str:
+    return str(value).replace("\t", " ").replace("\n", " ")
+
+
+def _tsv(surname: str, data: dict) -> str:
+    full_name = data["full_name"]
+    subjects = ";".join(f"{s}:{g}" for s, g in data["subjects"].items())
+    fields = [
+        surname,
+        full_name["first_name"],
+        full_name.get("patronymic", ""),
+        data["group"],
+        data["course"],
+        data["average"],
+        subjects,
+    ]
+    return "\t".join(map(_tsv_field, fields)) + "\n"
+
+
+def _jsonl(surname: str, data: dict) -> str:
+    record = {"surname": surname, **data, "subjects": dict(data["subjects"])}
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+class RecordsRenderer:
+    """
+    Buffered writer for student listings.
+
+    Records are formatted into one reused in-memory buffer that is
+    written to the output in large chunks, instead of one print() per
+    student. Besides the human-readable text layouts it can emit TSV
+    (with a header row) or JSON Lines for piping into other tools, and
+    it holds the page window (offset and page size) applied to every
+    listing.
+
+    Args:
+        out: output stream, sys.stdout if None
+        output_format: "text", "tsv" or "jsonl"
+        page_size: maximum number of students per listing, all if None
+        offset: number of leading students to skip
+        buffer_size: number of characters buffered before a write
+    """
+
+    def __init__(
+        self,
+        out: TextIO | None = None,
+        output_format: str = "text",
+        page_size: int | None = None,
+        offset: int = 0,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown output format '{output_format}'.")
+        self.out = out
+        self.output_format = output_format
+        self.page_size = page_size
+        self.offset = offset
+        self.buffer_size = buffer_size
+        self._buffer = io.StringIO()
+
+    def render(self, rows: Iterable[tuple[str, dict]], layout: str = "full") -> int:
+        """
+        Write (surname, record) pairs and return how many were written.
+
+        Rows are expected to be already limited to the page window.
+
+        Args:
+            rows: (surname, record) pairs to write
+            layout: text layout, "full", "ranked" or "sorted"
+        """
+        if self.output_format == "tsv":
+            format_row = _tsv
+            self._buffer.write("\t".join(TSV_COLUMNS) + "\n")
+        elif self.output_format == "jsonl":
+            format_row = _jsonl
+        else:
+            format_row = TEXT_LAYOUTS[layout]
+
+        count = 0
+        buffer = self._buffer
+        for surname, data in rows:
+            buffer.write(format_row(surname, data))
+            count += 1
+            if buffer.tell() >= self.buffer_size:
+                self.flush()
+        self.flush()
+        return count
+
+    def flush(self) -> None:
+        """Write the buffered text and reset the buffer."""
+        out = self.out or sys.stdout
+        out.write(self._buffer.getvalue())
+        out.flush()
+        self._buffer.seek(0)
+        self._buffer.truncate()
@@ -0,0 +1,317 @@
+import argparse
+import asyncio
+import json
+import os
+
+from compact_store import CompactStudentStore
+from records_journal import RecordsJournal
+from sqlite_store import SqliteStudentStore
+from student_store import StudentStore
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_LINE = 1024 * 1024
+# Reads run on the event loop; bounded pages keep each one short.
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+WRITE_OPS = {"add", "remove"}
+
+
+class RequestError(Exception):
+    """Invalid request; the message is sent back to the client."""
+
+
+def _plain(surname: str, data: dict) -> dict:
+    # Lazily loaded subjects are mappings, not dicts.
+    return {"surname": surname, **data, "subjects": dict(data["subjects"])}
+
+
+def _text(request: dict, field: str) -> str:
+    value = request.get(field)
+    if not isinstance(value, str) or not value.strip():
+        raise RequestError(f"'{field}' must be a non-empty string.")
+    return value.strip()
+
+
+def _page(request: dict) -> tuple[int, int]:
+    offset = request.get("offset", 0)
+    limit = request.get("limit", DEFAULT_PAGE_SIZE)
+    if type(offset) is not int or offset < 0:
+        raise RequestError("'offset' must be a non-negative integer.")
+    if type(limit) is not int or not 0 <= limit <= MAX_PAGE_SIZE:
+        raise RequestError(f"'limit' must be an integer from 0 to {MAX_PAGE_SIZE}.")
+    return offset, limit
+
+
+def make_record(request: dict) -> tuple[str, dict]:
+    """
+    Build a (surname, record) pair from an "add" request.
+
+    Applies the same rules as add_student in student_academic_records.
+
+    Args:
+        request: request with surname, group, first_name, patronymic,
+            course and subjects (subject -> grade)
+    """
+    surname = _text(request, "surname")
+    group = _text(request, "group")
+    first_name = _text(request, "first_name")
+    patronymic = request.get("patronymic") or ""
+    if not isinstance(patronymic, str):
+        raise RequestError("'patronymic' must be a string.")
+
+    course = request.get("course")
+    if type(course) is not int:
+        raise RequestError("Invalid course.")
+    if course < 1 or course > 6:
+        raise RequestError("Course must be between 1 and 6.")
+
+    subjects = request.get("subjects")
+    if not isinstance(subjects, dict) or not subjects:
+        raise RequestError("At least one subject with grade must be entered.")
+    for grade in subjects.values():
+        if type(grade) not in (int, float):
+            raise RequestError("Enter a valid grade.")
+        if grade < 0 or grade > 100:
+            raise RequestError("Grade must be between 0 and 100.")
+
+    return surname, {
+        "group": group,
+        "full_name": {
+            "surname": surname,
+            "first_name": first_name,
+            "patronymic": patronymic.strip(),
+        },
+        "course": course,
+        "subjects": subjects,
+        "average": round(sum(subjects.values()) / len(subjects), 2),
+    }
+
+
+class RecordsServer:
+    """
+    Line-delimited JSON server for a student store.
+
+    Each request is one JSON object per line with an "op" field and an
+    optional "id" that is echoed back; each response is one line with
+    "ok" and either "result" or "error". Operations:
+
+        add            surname, group, first_name, patronymic, course,
+                       subjects
+        remove         surname
+        get            surname
+        find_group     group, offset, limit
+        group_average  group
+        course_average course
+        sorted         by ("surname" or "average"), offset, limit
+        search         query
+        count
+
+    Lists are paged: "limit" defaults to DEFAULT_PAGE_SIZE and may not
+    exceed MAX_PAGE_SIZE.
+
+    All clients share one event loop. Reads are answered inline as soon
+    as their line arrives, without locks, but they are serialised on the
+    loop: while one read runs, no other client is served. Page limits
+    keep every read short. Writes are queued to a single writer task
+    that applies them in arrival order, so an add's duplicate check and
+    insert cannot interleave with another write.
+
+    Args:
+        students: StudentStore, CompactStudentStore or SqliteStudentStore
+    """
+
+    def __init__(self, students) -> None:
+        self.students = students
+        self._writes: asyncio.Queue | None = None
+        self._writer: asyncio.Task | None = None
+        self._reads = {
+            "get": self._get,
+            "find_group": self._find_group,
+            "group_average": self._group_average,
+            "course_average": self._course_average,
+            "sorted": self._sorted,
+            "search": self._search,
+            "count": lambda request: len(self.students),
+        }
+
+    async def start(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        path: str | None = None,
+    ) -> asyncio.AbstractServer:
+        """
+        Start listening on a TCP port, or on a Unix socket if path is set.
+
+        Returns:
+            the asyncio server; close it and call stop() to shut down
+        """
+        self._writes = asyncio.Queue()
+        self._writer = asyncio.create_task(self._apply_writes())
+        if path is not None:
+            return await asyncio.start_unix_server(
+                self._handle_client, path, limit=MAX_LINE
+            )
+        return await asyncio.start_server(
+            self._handle_client, host, port, limit=MAX_LINE
+        )
+
+    async def stop(self) -> None:
+        """Stop the writer task after the queued writes are applied."""
+        await self._writes.join()
+        self._writer.cancel()
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                response = await self._respond(line)
+                writer.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+                await writer.drain()
+        except (ValueError, ConnectionError):
+            # Line longer than MAX_LINE or client gone.
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes) -> dict:
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"ok": False, "error": "Invalid JSON."}
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Request must be a JSON object."}
+
+        response = {"id": request["id"]} if "id" in request else {}
+        op = request.get("op")
+        try:
+            if op in WRITE_OPS:
+                done = asyncio.get_running_loop().create_future()
+                await self._writes.put((request, done))
+                result = await done
+            elif op in self._reads:
+                result = self._reads[op](request)
+            else:
+                raise RequestError(f"Unknown operation '{op}'.")
+        except RequestError as e:
+            response.update(ok=False, error=str(e))
+        except Exception as e:
+            response.update(ok=False, error=f"Error: {e}")
+        else:
+            response.update(ok=True, result=result)
+        return response
+
+    async def _apply_writes(self) -> None:
+        while True:
+            request, done = await self._writes.get()
+            try:
+                if request["op"] == "add":
+                    done.set_result(self._add(request))
+                else:
+                    done.set_result(self._remove(request))
+            except Exception as e:
+                done.set_exception(e)
+            finally:
+                self._writes.task_done()
+
+    def _add(self, request: dict) -> str:
+        surname, data = make_record(request)
+        if surname in self.students:
+            raise RequestError(f"Student with surname '{surname}' already exists.")
+        self.students[surname] = data
+        return surname
+
+    def _remove(self, request: dict) -> str:
+        surname = _text(request, "surname")
+        if surname not in self.students:
+            raise RequestError("Student not found.")
+        del self.students[surname]
+        return surname
+
+    def _get(self, request: dict) -> dict:
+        surname = _text(request, "surname")
+        if surname not in self.students:
+            raise RequestError("Student not found.")
+        return _plain(surname, self.students[surname])
+
+    def _find_group(self, request: dict) -> list[dict]:
+        group = _text(request, "group")
+        offset, limit = _page(request)
+        pairs = self.students.find_by_group(group)[offset : offset + limit]
+        return [_plain(*pair) for pair in pairs]
+
+    def _group_average(self, request: dict) -> dict:
+        result = self.students.group_average(_text(request, "group"))
+        if result is None:
+            raise RequestError("Group not found.")
+        return {"average": round(result[0], 2), "count": result[1]}
+
+    def _course_average(self, request: dict) -> dict:
+        course = request.get("course")
+        if type(course) is not int:
+            raise RequestError("Invalid course.")
+        result = self.students.course_average(course)
+        if result is None:
+            raise RequestError("Course not found.")
+        return {"average": round(result[0], 2), "count": result[1]}
+
+    def _sorted(self, request: dict) -> list[dict]:
+        offset, limit = _page(request)
+        by = request.get("by", "surname")
+        if by == "surname":
+            pairs = self.students.sorted_by_surname(offset, limit)
+        elif by == "average":
+            pairs = self.students.ranked(offset, limit)
+        else:
+            raise RequestError("'by' must be 'surname' or 'average'.")
+        return [_plain(*pair) for pair in pairs]
+
+    def _search(self, request: dict) -> dict:
+        query = _text(request, "query")
+        return {
+            "prefix": self.students.search_prefix(query),
+            "similar": [surname for surname, _ in self.students.search_fuzzy(query)],
+        }
+
+
+async def serve(students, host: str, port: int, path: str | None) -> None:
+    """Run a RecordsServer until it is cancelled."""
+    server = RecordsServer(students)
+    listener = await server.start(host, port, path)
+    print(f"Serving {len(students)} students on {path or f'{host}:{port}'}")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Student academic records server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket")
+    parser.add_argument("--compact", action="store_true")
+    parser.add_argument("--sqlite", metavar="PATH", help="serve a SQLite database")
+    args = parser.parse_args()
+
+    json_file = os.path.join(os.path.dirname(__file__), "students_data.json")
+    journal = None
+    if args.sqlite:
+        students = SqliteStudentStore(args.sqlite)
+    else:
+        journal = RecordsJournal(json_file)
+        students = journal.load(
+            store_class=CompactStudentStore if args.compact else StudentStore
+        )
+    try:
+        asyncio.run(serve(students, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if journal is not None:
+            journal.close()
+        if isinstance(students, SqliteStudentStore):
+            students.close()
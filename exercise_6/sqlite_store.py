@@ -0,0 +1,383 @@
+import sqlite3
+from collections.abc import ItemsView, Iterable, Iterator, MutableMapping
+from itertools import groupby
+
+from surname_index import masked_keys, query_keys, within_one_edit
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY,
+    surname TEXT NOT NULL UNIQUE,
+    folded TEXT NOT NULL,
+    "group" TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    patronymic TEXT NOT NULL,
+    course INTEGER NOT NULL,
+    average NOT NULL
+);
+CREATE INDEX IF NOT EXISTS students_group ON students ("group", average);
+CREATE INDEX IF NOT EXISTS students_course ON students (course, average);
+CREATE INDEX IF NOT EXISTS students_average ON students (average DESC, surname);
+CREATE INDEX IF NOT EXISTS students_folded ON students (folded, surname);
+
+CREATE TABLE IF NOT EXISTS grades (
+    id INTEGER PRIMARY KEY,
+    student_id INTEGER NOT NULL REFERENCES students (id) ON DELETE CASCADE,
+    subject TEXT NOT NULL,
+    grade NOT NULL
+);
+CREATE INDEX IF NOT EXISTS grades_student ON grades (student_id);
+CREATE INDEX IF NOT EXISTS grades_subject ON grades (subject, grade);
+
+-- Running sum and count of grades per subject, like StudentStore keeps.
+CREATE TABLE IF NOT EXISTS subject_totals (
+    subject TEXT PRIMARY KEY,
+    total NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS grades_insert AFTER INSERT ON grades BEGIN
+    INSERT INTO subject_totals (subject, total, count)
+    VALUES (new.subject, new.grade, 1)
+    ON CONFLICT (subject) DO UPDATE SET
+        total = total + new.grade, count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS grades_delete AFTER DELETE ON grades BEGIN
+    UPDATE subject_totals SET total = total - old.grade, count = count - 1
+    WHERE subject = old.subject;
+    DELETE FROM subject_totals WHERE subject = old.subject AND count = 0;
+END;
+
+CREATE TABLE IF NOT EXISTS surname_keys (
+    key TEXT NOT NULL,
+    student_id INTEGER NOT NULL REFERENCES students (id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS surname_keys_key ON surname_keys (key);
+CREATE INDEX IF NOT EXISTS surname_keys_student ON surname_keys (student_id);
+"""
+
+_UPSERT = """
+INSERT INTO students (
+    surname, folded, "group", first_name, patronymic, course, average
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (surname) DO UPDATE SET
+    "group" = excluded."group",
+    first_name = excluded.first_name,
+    patronymic = excluded.patronymic,
+    course = excluded.course,
+    average = excluded.average
+RETURNING id
+"""
+
+# Students of one page joined with their grades; {where} and {order}
+# apply to the students table aliased as s.
+_SELECT = """
+SELECT s.surname, s."group", s.first_name, s.patronymic, s.course, s.average,
+    g.subject, g.grade
+FROM (
+    SELECT * FROM students AS s {where} ORDER BY {order} LIMIT ? OFFSET ?
+) AS s
+LEFT JOIN grades AS g ON g.student_id = s.id
+ORDER BY {order}, g.id
+"""
+
+
+class SqliteStudentStore(MutableMapping):
+    """
+    Student records kept in a local SQLite database.
+
+    A drop-in replacement for StudentStore that does not load the roster
+    into memory: opening the store costs the same for any number of
+    students, and every menu operation is one indexed query. Students
+    are a table indexed by group, course and average, grades are a
+    child table indexed by subject, so group and course averages,
+    subject statistics and ranked or alphabetical pages are computed by
+    SQLite instead of Python loops. Roster order is the insertion order
+    (the row id), as with a dictionary.
+
+    Surname search uses a case-folded surname column for prefixes and
+    a table of masked-piece keys (see SurnameIndex) for typos.
+
+    Args:
+        path: path to the database file, created if missing
+    """
+
+    track_subjects = True
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def __getitem__(self, surname: str) -> dict:
+        for _, data in self._select("WHERE s.surname = ?", "s.id", (surname,)):
+            return data
+        raise KeyError(surname)
+
+    def __setitem__(self, surname: str, data: dict) -> None:
+        with self._db:
+            self._write(surname, data)
+
+    def __delitem__(self, surname: str) -> None:
+        with self._db:
+            deleted = self._db.execute(
+                "DELETE FROM students WHERE surname = ?", (surname,)
+            ).rowcount
+        if not deleted:
+            raise KeyError(surname)
+
+    def __contains__(self, surname: object) -> bool:
+        row = self._db.execute(
+            "SELECT 1 FROM students WHERE surname = ?", (surname,)
+        ).fetchone()
+        return row is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for (surname,) in self._db.execute("SELECT surname FROM students ORDER BY id"):
+            yield surname
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+
+    def __bool__(self) -> bool:
+        # COUNT(*) scans the whole table; emptiness needs one row at most.
+        row = self._db.execute("SELECT 1 FROM students LIMIT 1").fetchone()
+        return row is not None
+
+    def items(self) -> ItemsView:
+        """Return a view of (surname, record) pairs read in one query."""
+        return _ItemsView(self)
+
+    def extend(self, items: Iterable[tuple[str, dict]]) -> None:
+        """
+        Add many (surname, record) pairs in one transaction.
+
+        Args:
+            items: iterable of (surname, record) pairs
+        """
+        with self._db:
+            for surname, data in items:
+                self._write(surname, data)
+
+    def _write(self, surname: str, data: dict) -> None:
+        full_name = data["full_name"]
+        folded = surname.casefold()
+        (student_id,) = self._db.execute(
+            _UPSERT,
+            (
+                surname,
+                folded,
+                data["group"],
+                full_name["first_name"],
+                full_name.get("patronymic", ""),
+                data["course"],
+                data["average"],
+            ),
+        ).fetchone()
+        self._db.execute("DELETE FROM grades WHERE student_id = ?", (student_id,))
+        self._db.executemany(
+            "INSERT INTO grades (student_id, subject, grade) VALUES (?, ?, ?)",
+            [
+                (student_id, subject, grade)
+                for subject, grade in data["subjects"].items()
+            ],
+        )
+        self._db.execute("DELETE FROM surname_keys WHERE student_id = ?", (student_id,))
+        self._db.executemany(
+            "INSERT INTO surname_keys (key, student_id) VALUES (?, ?)",
+            [(key, student_id) for key in masked_keys(folded)],
+        )
+
+    def _select(
+        self,
+        where: str,
+        order: str,
+        params: tuple = (),
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[tuple[str, dict]]:
+        sql = _SELECT.format(where=where, order=order)
+        rows = self._db.execute(sql, (*params, -1 if limit is None else limit, offset))
+        for surname, student_rows in groupby(rows, key=lambda row: row[0]):
+            student_rows = list(student_rows)
+            first = student_rows[0]
+            subjects = {row[6]: row[7] for row in student_rows if row[6] is not None}
+            yield (
+                surname,
+                {
+                    "group": first[1],
+                    "full_name": {
+                        "surname": surname,
+                        "first_name": first[2],
+                        "patronymic": first[3],
+                    },
+                    "course": first[4],
+                    "subjects": subjects,
+                    "average": first[5],
+                },
+            )
+
+    def groups(self) -> list[str]:
+        """Return all group numbers present in the store."""
+        rows = self._db.execute('SELECT DISTINCT "group" FROM students')
+        return [group for (group,) in rows]
+
+    def find_by_group(self, group: str) -> list[tuple[str, dict]]:
+        """
+        Return (surname, record) pairs of students in a group.
+
+        Args:
+            group: group number to look up
+        """
+        return list(self._select('WHERE s."group" = ?', "s.id", (group,)))
+
+    def group_average(self, group: str) -> tuple[float, int] | None:
+        """
+        Return (average grade, number of students) for a group.
+
+        Args:
+            group: group number to look up
+        """
+        return self._average('"group"', group)
+
+    def course_average(self, course: int) -> tuple[float, int] | None:
+        """
+        Return (average grade, number of students) for a course.
+
+        Args:
+            course: course number to look up
+        """
+        return self._average("course", course)
+
+    def _average(self, column: str, value) -> tuple[float, int] | None:
+        average, count = self._db.execute(
+            f"SELECT AVG(average), COUNT(*) FROM students WHERE {column} = ?",
+            (value,),
+        ).fetchone()
+        if not count:
+            return None
+        return average, count
+
+    def subjects(self) -> list[str]:
+        """Return all subject names present in the store."""
+        rows = self._db.execute("SELECT subject FROM subject_totals")
+        return [subject for (subject,) in rows]
+
+    def subject_stats(self, subject: str) -> dict | None:
+        """
+        Return mean, min, max and count of grades for a subject.
+
+        Args:
+            subject: subject name to look up
+        """
+        row = self._db.execute(
+            "SELECT total, count FROM subject_totals WHERE subject = ?", (subject,)
+        ).fetchone()
+        if row is None:
+            return None
+        # Separate queries, so SQLite answers each from the index ends.
+        low = self._db.execute(
+            "SELECT MIN(grade) FROM grades WHERE subject = ?", (subject,)
+        ).fetchone()[0]
+        high = self._db.execute(
+            "SELECT MAX(grade) FROM grades WHERE subject = ?", (subject,)
+        ).fetchone()[0]
+        total, count = row
+        return {"mean": total / count, "min": low, "max": high, "count": count}
+
+    def ranked(
+        self, offset: int = 0, limit: int | None = None
+    ) -> list[tuple[str, dict]]:
+        """
+        Return (surname, record) pairs ordered by average grade (descending).
+
+        Ties are ordered by surname.
+
+        Args:
+            offset: number of leading students to skip
+            limit: maximum number of students to return, all if None
+        """
+        order = "s.average DESC, s.surname"
+        return list(self._select("", order, (), offset, limit))
+
+    def top(self, k: int) -> list[tuple[str, dict]]:
+        """
+        Return the k students with the highest average grade.
+
+        Args:
+            k: number of students to return
+        """
+        return self.ranked(0, k)
+
+    def sorted_by_surname(
+        self, offset: int = 0, limit: int | None = None
+    ) -> list[tuple[str, dict]]:
+        """
+        Return (surname, record) pairs ordered by surname.
+
+        Args:
+            offset: number of leading students to skip
+            limit: maximum number of students to return, all if None
+        """
+        return list(self._select("", "s.surname", (), offset, limit))
+
+    def page(self, offset: int = 0, limit: int | None = None) -> list[tuple[str, dict]]:
+        """
+        Return (surname, record) pairs in insertion order.
+
+        Args:
+            offset: number of leading students to skip
+            limit: maximum number of students to return, all if None
+        """
+        return list(self._select("", "s.id", (), offset, limit))
+
+    def search_prefix(self, prefix: str, limit: int = 10) -> list[str]:
+        """
+        Return up to limit surnames starting with prefix (case-insensitive).
+
+        Args:
+            prefix: beginning of the surname
+            limit: maximum number of surnames to return
+        """
+        folded = prefix.casefold()
+        rows = self._db.execute(
+            "SELECT surname FROM students WHERE folded >= ? AND folded < ? "
+            "ORDER BY folded, surname LIMIT ?",
+            (folded, folded + "\U0010ffff", limit),
+        )
+        return [surname for (surname,) in rows]
+
+    def search_fuzzy(self, query: str, limit: int = 10) -> list[tuple[str, int]]:
+        """
+        Return up to limit (surname, edits) pairs within one typo of query.
+
+        Args:
+            query: surname to look for, possibly misspelled
+            limit: maximum number of surnames to return
+        """
+        folded = query.casefold()
+        found: dict[str, int] = {}
+        for key, start, end, middle in query_keys(folded):
+            rows = self._db.execute(
+                "SELECT s.surname, s.folded FROM surname_keys AS k "
+                "JOIN students AS s ON s.id = k.student_id WHERE k.key = ?",
+                (key,),
+            )
+            for surname, candidate in rows:
+                if surname not in found and within_one_edit(
+                    middle, candidate[start:end]
+                ):
+                    found[surname] = int(candidate != folded)
+        matches = sorted((edits, surname) for surname, edits in found.items())
+        return [(surname, edits) for edits, surname in matches[:limit]]
+
+
+class _ItemsView(ItemsView):
+    def __iter__(self) -> Iterator[tuple[str, dict]]:
+        return self._mapping._select("", "s.id")
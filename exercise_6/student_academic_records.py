@@ -1,13 +1,22 @@
+import argparse
 import json
 import os
+import sys
+from itertools import islice
 
+from compact_store import CompactStudentStore
+from records_journal import RecordsJournal
+from records_renderer import FORMATS, RecordsRenderer
+from sqlite_store import SqliteStudentStore
+from student_store import StudentStore
 
-def add_student(students: dict) -> None:
+
+def add_student(students: StudentStore) -> None:
     """
     Add a new student to the dictionary.
     Author: Yevtushenko Oleksii
     Args:
-        students: dictionary with student data
+        students: store with student data
     """
     try:
         # Enter surname (dictionary key)
@@ -78,33 +87,32 @@ def add_student(students: dict) -> None:
         print(f"Error: {e}")
 
 
-def display_all_students(students: dict) -> None:
+def display_all_students(
+    students: StudentStore, renderer: RecordsRenderer | None = None
+) -> None:
     """
     Display all values from the dictionary.
     Author: Yevtushenko Oleksii
     Args:
-        students: dictionary with student data
+        students: store with student data
+        renderer: output renderer (format and page window)
     """
     if not students:
         print("No students.")
         return
 
-    for surname, data in students.items():
-        full_name = data["full_name"]
-        name_str = (
-            f"{full_name['first_name']} {full_name.get('patronymic', '')}".strip()
-        )
-        subjects_str = ", ".join([f"{s}: {g}" for s, g in data["subjects"].items()])
-        print(
-            f"{surname} {name_str} - "
-            f"Group: {data['group']}, "
-            f"Course: {data['course']}, "
-            f"Avg: {data['average']} | "
-            f"{subjects_str}"
-        )
+    renderer = renderer or RecordsRenderer()
+    if renderer.page_size is None:
+        # Everything from offset on: stream it rather than build a list.
+        pairs = islice(students.items(), renderer.offset, None)
+    else:
+        pairs = students.page(renderer.offset, renderer.page_size)
+    renderer.render(pairs, "full")
 
 
-def sort_students_by_average_grade(students: dict) -> None:
+def sort_students_by_average_grade(
+    students: StudentStore, renderer: RecordsRenderer | None = None
+) -> None:
     """
     Sort dictionary data by average grade (descending).
     Author: Yevtushenko Oleksii
@@ -113,31 +121,55 @@ def sort_students_by_average_grade(students: dict) -> None:
     from highest to lowest.
 
     Args:
-        students: dictionary with student data
+        students: store with student data
+        renderer: output renderer (format and page window)
     """
     if not students:
         print("No students.")
         return
 
-    sorted_students = sorted(
-        students.items(), key=lambda x: x[1]["average"], reverse=True
-    )
-    for surname, data in sorted_students:
-        full_name = data["full_name"]
-        name_str = (
-            f"{full_name['first_name']} {full_name.get('patronymic', '')}".strip()
-        )
-        print(
-            f"{surname} {name_str}: {data['average']} (group {data['group']}, course {data['course']})"
-        )
+    renderer = renderer or RecordsRenderer()
+    renderer.render(students.ranked(renderer.offset, renderer.page_size), "ranked")
+
+
+def display_ranking_page(students: StudentStore) -> None:
+    """
+    Display one page of students ranked by average grade.
+
+    Page 1 with page size K shows the top K students.
+
+    Args:
+        students: store with student data
+    """
+    if not students:
+        print("No students.")
+        return
+    try:
+        page_size = int(input("Enter page size: "))
+        page = int(input("Enter page number: "))
+    except ValueError:
+        print("Error: Invalid input.")
+        return
+    if page_size < 1 or page < 1:
+        print("Error: Page size and page number must be positive.")
+        return
+
+    offset = (page - 1) * page_size
+    ranked = students.ranked(offset, page_size)
+    if not ranked:
+        print(f"Page {page} is empty.")
+        return
+
+    for place, (surname, data) in enumerate(ranked, offset + 1):
+        print(f"{place}. {surname}: {data['average']} (group {data['group']})")
 
 
-def find_students_by_group(students: dict) -> None:
+def find_students_by_group(students: StudentStore) -> None:
     """
     Search for students by group number.
     Author: Yevtushenko Oleksii
     Args:
-        students: dictionary with student data
+        students: store with student data
     """
     if not students:
         print("Dictionary is empty.")
@@ -147,10 +179,8 @@ def find_students_by_group(students: dict) -> None:
         print("Error: Group number cannot be empty.")
         return
 
-    # Search students by group
-    found_students = [
-        (surname, data) for surname, data in students.items() if data["group"] == group
-    ]
+    # Search students by group through the group index
+    found_students = students.find_by_group(group)
 
     if not found_students:
         print(f"Group '{group}' not found.")
@@ -167,37 +197,65 @@ def find_students_by_group(students: dict) -> None:
         )
 
 
-def display_sorted_by_keys(students: dict) -> None:
+def display_sorted_by_keys(
+    students: StudentStore, renderer: RecordsRenderer | None = None
+) -> None:
     """
     View dictionary content sorted by keys (surnames).
     Author: Yevtushenko Oleksii
 
-    Uses sorted() function to sort keys.
+    Uses the surname order maintained by the store.
 
     Args:
-        students: dictionary with student data
+        students: store with student data
+        renderer: output renderer (format and page window)
     """
     if not students:
         print("No students.")
         return
 
-    for key in sorted(students.keys()):
-        data = students[key]
-        full_name = data["full_name"]
-        name_str = (
-            f"{full_name['first_name']} {full_name.get('patronymic', '')}".strip()
-        )
-        print(
-            f"{key} {name_str} - Group: {data['group']}, Course: {data['course']}, Average: {data['average']}"
-        )
+    renderer = renderer or RecordsRenderer()
+    renderer.render(
+        students.sorted_by_surname(renderer.offset, renderer.page_size), "sorted"
+    )
+
+
+def search_students_by_surname(students: StudentStore) -> None:
+    """
+    Search students by the beginning of the surname, or by a misspelled one.
+    Args:
+        students: store with student data
+    """
+    if not students:
+        print("No students.")
+        return
+    query = input("Enter surname or its beginning: ").strip()
+    if not query:
+        print("Error: Surname cannot be empty.")
+        return
+
+    found = students.search_prefix(query)
+    if found:
+        for surname in found:
+            data = students[surname]
+            print(f"  {surname} - group {data['group']}, avg: {data['average']}")
+        return
+
+    similar = students.search_fuzzy(query, 5)
+    if not similar:
+        print(f"No surnames similar to '{query}'.")
+        return
+    print("No surnames start with it. Did you mean:")
+    for surname, _ in similar:
+        print(f"  {surname} - group {students[surname]['group']}")
 
 
-def remove_student(students: dict) -> None:
+def remove_student(students: StudentStore) -> None:
     """
     Remove a student record from the dictionary.
     Author: Yevtushenko Oleksii
     Args:
-        students: dictionary with student data
+        students: store with student data
     """
     if not students:
         print("No students.")
@@ -210,12 +268,12 @@ def remove_student(students: dict) -> None:
     print(f"Removed: {surname}")
 
 
-def calculate_group_average_grade(students: dict) -> None:
+def calculate_group_average_grade(students: StudentStore) -> None:
     """
     Calculate average grade for a group.
     Author: Yevtushenko Oleksii
     Args:
-        students: dictionary with student data
+        students: store with student data
     """
     if not students:
         print("No students.")
@@ -225,26 +283,67 @@ def calculate_group_average_grade(students: dict) -> None:
         print("Error: Invalid input.")
         return
 
-    group_averages = [
-        data["average"] for surname, data in students.items() if data["group"] == group
-    ]
-
-    if not group_averages:
+    result = students.group_average(group)
+    if result is None:
         print(f"Group '{group}' not found.")
         return
 
-    group_average = sum(group_averages) / len(group_averages)
-    print(
-        f"Group '{group}' average: {round(group_average, 2)} ({len(group_averages)} students)"
-    )
+    group_average, count = result
+    print(f"Group '{group}' average: {round(group_average, 2)} ({count} students)")
+
+
+def calculate_course_average_grade(students: StudentStore) -> None:
+    """
+    Calculate average grade for a course.
+    Args:
+        students: store with student data
+    """
+    if not students:
+        print("No students.")
+        return
+    try:
+        course = int(input("Enter course: "))
+    except ValueError:
+        print("Error: Invalid input.")
+        return
+
+    result = students.course_average(course)
+    if result is None:
+        print(f"Course {course} not found.")
+        return
+
+    course_average, count = result
+    print(f"Course {course} average: {round(course_average, 2)} ({count} students)")
+
+
+def display_subject_statistics(students: StudentStore) -> None:
+    """
+    Display mean, minimum and maximum grade for every subject.
+    Args:
+        students: store with student data
+    """
+    if not students:
+        print("No students.")
+        return
+    if not students.track_subjects:
+        print("Subject statistics are not tracked in lazy mode.")
+        return
 
+    for subject in students.subjects():
+        stats = students.subject_stats(subject)
+        print(
+            f"{subject}: mean {round(stats['mean'], 2)}, "
+            f"min {stats['min']}, max {stats['max']} ({stats['count']} grades)"
+        )
 
-def main_menu(students: dict) -> None:
+
+def main_menu(students: StudentStore, renderer: RecordsRenderer | None = None) -> None:
     """
     Main menu for working with dictionary.
     Author: Yevtushenko Oleksii
     Args:
-        students: dictionary with student data
+        students: store with student data
+        renderer: output renderer for student listings
     """
     while True:
         print("\n" + "=" * 80)
@@ -257,20 +356,24 @@ def main_menu(students: dict) -> None:
         print("5. Find students by group")
         print("6. Calculate group average grade")
         print("7. Remove student")
-        print("8. Exit")
+        print("8. Calculate course average grade")
+        print("9. Display subject statistics")
+        print("10. Display ranking page (top K)")
+        print("11. Search students by surname")
+        print("12. Exit")
         print("=" * 80)
 
-        choice = input("Enter your choice (1-8): ").strip()
+        choice = input("Enter your choice (1-12): ").strip()
 
         match choice:
             case "1":
                 add_student(students)
             case "2":
-                display_all_students(students)
+                display_all_students(students, renderer)
             case "3":
-                display_sorted_by_keys(students)
+                display_sorted_by_keys(students, renderer)
             case "4":
-                sort_students_by_average_grade(students)
+                sort_students_by_average_grade(students, renderer)
             case "5":
                 find_students_by_group(students)
             case "6":
@@ -278,24 +381,122 @@ def main_menu(students: dict) -> None:
             case "7":
                 remove_student(students)
             case "8":
+                calculate_course_average_grade(students)
+            case "9":
+                display_subject_statistics(students)
+            case "10":
+                display_ranking_page(students)
+            case "11":
+                search_students_by_surname(students)
+            case "12":
                 break
             case _:
                 print("Invalid choice.")
 
 
+def print_load_progress(count: int, bytes_read: int, total: int) -> None:
+    """
+    Print loading progress on a single line.
+    Args:
+        count: number of students loaded so far
+        bytes_read: number of bytes read so far
+        total: file size in bytes
+    """
+    percent = bytes_read * 100 // total if total else 100
+    end = "\n" if bytes_read >= total else ""
+    print(
+        f"\rLoading students: {count} ({percent}%)",
+        end=end,
+        file=sys.stderr,
+        flush=True,
+    )
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Student academic records")
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="decode each student's subjects only when they are displayed",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="keep records in the compact store (less memory per student)",
+    )
+    parser.add_argument(
+        "--sqlite",
+        nargs="?",
+        const=os.path.join(os.path.dirname(__file__), "students_data.db"),
+        metavar="PATH",
+        help="keep records in a SQLite database instead of loading the JSON "
+        "file (imported from it on first use)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="text",
+        help="output format of student listings",
+    )
+    parser.add_argument(
+        "--page-size", type=int, help="maximum number of students per listing"
+    )
+    parser.add_argument(
+        "--offset", type=int, default=0, help="number of leading students to skip"
+    )
+    parser.add_argument(
+        "--dump",
+        choices=["all", "surname", "average"],
+        help="print one listing (all / sorted by surname / by average) and exit",
+    )
+    args = parser.parse_args()
+    if args.page_size is not None and args.page_size < 1:
+        parser.error("--page-size must be positive")
+    if args.offset < 0:
+        parser.error("--offset must not be negative")
+    if args.sqlite and (args.lazy or args.compact):
+        parser.error("--sqlite cannot be combined with --lazy or --compact")
+    if args.lazy and args.compact:
+        # The compact store packs every record on insert, which decodes
+        # lazy subjects straight away.
+        parser.error("--lazy cannot be combined with --compact")
+    renderer = RecordsRenderer(
+        output_format=args.format, page_size=args.page_size, offset=args.offset
+    )
+    store_class = CompactStudentStore if args.compact else StudentStore
+
     json_file = os.path.join(os.path.dirname(__file__), "students_data.json")
+    journal = RecordsJournal(json_file)
 
     try:
-        with open(json_file, "r", encoding="utf-8") as f:
-            students = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: File '{json_file}' not found.")
-        students = {}
+        if args.sqlite:
+            students = SqliteStudentStore(args.sqlite)
+            if not students:
+                journal.restore(students, print_load_progress)
+            journal = None
+        else:
+            students = journal.load(print_load_progress, args.lazy, store_class)
     except json.JSONDecodeError:
         print(f"Error: Invalid JSON in file '{json_file}'.")
-        students = {}
+        students = store_class()
+        journal = None
     except Exception as e:
         print(f"Error loading data: {e}")
-        students = {}
-    main_menu(students)
+        students = store_class()
+        journal = None
+
+    dump_listings = {
+        "all": display_all_students,
+        "surname": display_sorted_by_keys,
+        "average": sort_students_by_average_grade,
+    }
+    try:
+        if args.dump:
+            dump_listings[args.dump](students, renderer)
+        else:
+            main_menu(students, renderer)
+    finally:
+        if journal is not None:
+            journal.close()
+        if isinstance(students, SqliteStudentStore):
+            students.close()
@@ -0,0 +1,332 @@
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from itertools import islice
+
+from surname_index import SurnameIndex
+
+
+class StudentStore(MutableMapping):
+    """
+    Dictionary of student records with a maintained group index.
+
+    Behaves like the plain ``students`` dictionary (surname -> record),
+    but keeps a group -> surnames index in sync on every insert and
+    removal, so group lookups cost the size of the group instead of
+    the size of the whole roster.
+
+    Running sums and counts of averages are kept per group and per
+    course, and every subject keeps a running sum plus its grades in
+    sorted order, so averages, minimums and maximums are answered
+    without touching individual records.
+
+    Surnames are also kept in two sorted lists, one ranked by
+    (average descending, surname) and one by surname, so ranked and
+    alphabetical pages are served as slices in O(log n + k) instead of
+    a full sort per call. A SurnameIndex serves case-insensitive prefix
+    and typo-tolerant surname searches; it roughly doubles the memory
+    per student, so it is built on the first search and maintained from
+    then on.
+
+    If ``journal`` is set (see ``records_journal.RecordsJournal``),
+    every mutation is appended to it before being applied.
+
+    Args:
+        students: initial dictionary with student data
+        track_subjects: keep per-subject aggregates; disable it when
+            records are loaded lazily, so that ``subjects`` is not
+            decoded on insert
+    """
+
+    def __init__(
+        self, students: dict | None = None, track_subjects: bool = True
+    ) -> None:
+        self.journal = None
+        self.track_subjects = track_subjects
+        self._records: dict[str, dict] = {}
+        # Inner dicts are used as ordered sets to keep roster order.
+        self._groups: dict[str, dict[str, None]] = {}
+        # [sum of averages, number of students]
+        self._group_totals: dict[str, list[float]] = {}
+        self._course_totals: dict[int, list[float]] = {}
+        self._subject_sums: dict[str, float] = {}
+        self._subject_grades: dict[str, list[float]] = {}
+        # (-average, surname) so ascending order ranks best students first
+        self._by_average: list[tuple[float, str]] = []
+        self._by_surname: list[str] = []
+        self._surname_index: SurnameIndex | None = None
+        if students:
+            self.extend(students.items())
+
+    def __getitem__(self, surname: str) -> dict:
+        return self._unpack(surname, self._records[surname])
+
+    def __setitem__(self, surname: str, data: dict) -> None:
+        if self.journal is not None:
+            self.journal.record_add(surname, data)
+        if surname in self._records:
+            self._unindex(surname, self[surname])
+        self._records[surname] = self._pack(surname, data)
+        self._index(surname, data)
+
+    def __delitem__(self, surname: str) -> None:
+        if surname not in self._records:
+            raise KeyError(surname)
+        if self.journal is not None:
+            self.journal.record_remove(surname)
+        data = self[surname]
+        del self._records[surname]
+        self._unindex(surname, data)
+
+    def __contains__(self, surname: object) -> bool:
+        return surname in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def extend(self, items: Iterable[tuple[str, dict]]) -> None:
+        """
+        Add many (surname, record) pairs at once.
+
+        Sorted indexes are appended to and sorted once at the end,
+        instead of one insort per student.
+
+        Args:
+            items: iterable of (surname, record) pairs
+        """
+        unsorted = False
+        for surname, data in items:
+            if self.journal is not None:
+                self.journal.record_add(surname, data)
+            if surname in self._records:
+                if unsorted:
+                    self._sort_indexes()
+                    unsorted = False
+                self._unindex(surname, self[surname])
+            self._records[surname] = self._pack(surname, data)
+            self._index(surname, data, ordered=False)
+            unsorted = True
+        if unsorted:
+            self._sort_indexes()
+
+    def snapshot(self) -> Callable[[], dict]:
+        """
+        Return a function that builds a plain dict of the current records.
+
+        Only a shallow copy of the stored records is made now, in C;
+        records are replaced, never mutated in place, so decoding them
+        can happen later on another thread.
+        """
+        records = dict(self._records)
+        unpack = self._unpack
+        return lambda: {
+            surname: unpack(surname, packed) for surname, packed in records.items()
+        }
+
+    def _pack(self, surname: str, data: dict):
+        """Convert a record to its stored form; subclasses override this."""
+        return data
+
+    def _unpack(self, surname: str, packed) -> dict:
+        """Convert a stored record back to a dictionary."""
+        return packed
+
+    def _index(self, surname: str, data: dict, ordered: bool = True) -> None:
+        add = insort if ordered else list.append
+        self._groups.setdefault(data["group"], {})[surname] = None
+        _add_to_total(self._group_totals, data["group"], data["average"])
+        _add_to_total(self._course_totals, data["course"], data["average"])
+        if self.track_subjects:
+            for subject, grade in data["subjects"].items():
+                self._subject_sums[subject] = self._subject_sums.get(subject, 0) + grade
+                add(self._subject_grades.setdefault(subject, []), grade)
+        add(self._by_average, (-data["average"], surname))
+        add(self._by_surname, surname)
+        if self._surname_index is not None:
+            self._surname_index.add(surname, ordered)
+
+    def _sort_indexes(self) -> None:
+        for grades in self._subject_grades.values():
+            grades.sort()
+        self._by_average.sort()
+        self._by_surname.sort()
+        if self._surname_index is not None:
+            self._surname_index.sort()
+
+    def _unindex(self, surname: str, data: dict) -> None:
+        members = self._groups[data["group"]]
+        del members[surname]
+        if not members:
+            del self._groups[data["group"]]
+        _remove_from_total(self._group_totals, data["group"], data["average"])
+        _remove_from_total(self._course_totals, data["course"], data["average"])
+        if self.track_subjects:
+            for subject, grade in data["subjects"].items():
+                grades = self._subject_grades[subject]
+                _remove_sorted(grades, grade)
+                if grades:
+                    self._subject_sums[subject] -= grade
+                else:
+                    del self._subject_grades[subject]
+                    del self._subject_sums[subject]
+        _remove_sorted(self._by_average, (-data["average"], surname))
+        _remove_sorted(self._by_surname, surname)
+        if self._surname_index is not None:
+            self._surname_index.remove(surname)
+
+    def _surnames(self) -> SurnameIndex:
+        if self._surname_index is None:
+            index = SurnameIndex()
+            for surname in self._records:
+                index.add(surname, ordered=False)
+            index.sort()
+            self._surname_index = index
+        return self._surname_index
+
+    def groups(self) -> list[str]:
+        """Return all group numbers present in the store."""
+        return list(self._groups)
+
+    def find_by_group(self, group: str) -> list[tuple[str, dict]]:
+        """
+        Return (surname, record) pairs of students in a group.
+
+        Args:
+            group: group number to look up
+        """
+        members = self._groups.get(group, {})
+        return [(surname, self[surname]) for surname in members]
+
+    def group_average(self, group: str) -> tuple[float, int] | None:
+        """
+        Return (average grade, number of students) for a group.
+
+        Args:
+            group: group number to look up
+        """
+        return _average(self._group_totals.get(group))
+
+    def course_average(self, course: int) -> tuple[float, int] | None:
+        """
+        Return (average grade, number of students) for a course.
+
+        Args:
+            course: course number to look up
+        """
+        return _average(self._course_totals.get(course))
+
+    def subjects(self) -> list[str]:
+        """Return all subject names present in the store."""
+        return list(self._subject_grades)
+
+    def subject_stats(self, subject: str) -> dict | None:
+        """
+        Return mean, min, max and count of grades for a subject.
+
+        Args:
+            subject: subject name to look up
+        """
+        grades = self._subject_grades.get(subject)
+        if not grades:
+            return None
+        return {
+            "mean": self._subject_sums[subject] / len(grades),
+            "min": grades[0],
+            "max": grades[-1],
+            "count": len(grades),
+        }
+
+    def ranked(
+        self, offset: int = 0, limit: int | None = None
+    ) -> list[tuple[str, dict]]:
+        """
+        Return (surname, record) pairs ordered by average grade (descending).
+
+        Ties are ordered by surname.
+
+        Args:
+            offset: number of leading students to skip
+            limit: maximum number of students to return, all if None
+        """
+        end = None if limit is None else offset + limit
+        return [(surname, self[surname]) for _, surname in self._by_average[offset:end]]
+
+    def top(self, k: int) -> list[tuple[str, dict]]:
+        """
+        Return the k students with the highest average grade.
+
+        Args:
+            k: number of students to return
+        """
+        return self.ranked(0, k)
+
+    def sorted_by_surname(
+        self, offset: int = 0, limit: int | None = None
+    ) -> list[tuple[str, dict]]:
+        """
+        Return (surname, record) pairs ordered by surname.
+
+        Args:
+            offset: number of leading students to skip
+            limit: maximum number of students to return, all if None
+        """
+        end = None if limit is None else offset + limit
+        return [(surname, self[surname]) for surname in self._by_surname[offset:end]]
+
+    def page(self, offset: int = 0, limit: int | None = None) -> list[tuple[str, dict]]:
+        """
+        Return (surname, record) pairs in insertion order.
+
+        Args:
+            offset: number of leading students to skip
+            limit: maximum number of students to return, all if None
+        """
+        end = None if limit is None else offset + limit
+        return list(islice(self.items(), offset, end))
+
+    def search_prefix(self, prefix: str, limit: int = 10) -> list[str]:
+        """
+        Return up to limit surnames starting with prefix (case-insensitive).
+
+        Args:
+            prefix: beginning of the surname
+            limit: maximum number of surnames to return
+        """
+        return self._surnames().prefix(prefix, limit)
+
+    def search_fuzzy(self, query: str, limit: int = 10) -> list[tuple[str, int]]:
+        """
+        Return up to limit (surname, edits) pairs within one typo of query.
+
+        Args:
+            query: surname to look for, possibly misspelled
+            limit: maximum number of surnames to return
+        """
+        return self._surnames().fuzzy(query, limit)
+
+
+def _remove_sorted(items: list, item) -> None:
+    del items[bisect_left(items, item)]
+
+
+def _add_to_total(totals: dict, key, value: float) -> None:
+    total = totals.setdefault(key, [0.0, 0])
+    total[0] += value
+    total[1] += 1
+
+
+def _remove_from_total(totals: dict, key, value: float) -> None:
+    total = totals[key]
+    total[1] -= 1
+    if total[1]:
+        total[0] -= value
+    else:
+        del totals[key]
+
+
+def _average(total: list[float] | None) -> tuple[float, int] | None:
+    if not total:
+        return None
+    return total[0] / total[1], total[1]
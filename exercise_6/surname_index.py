@@ -0,0 +1,201 @@
+from bisect import bisect_left, insort
+from collections.abc import Iterator
+
+# Fuzzy matches are surnames within one edit of the query. Surnames are
+# split into three pieces; one edit changes at most one of them.
+PIECES = 3
+
+
+def _piece_bounds(length: int, piece: int) -> tuple[int, int]:
+    """Return the (start, end) of a piece of a word of the given length."""
+    short, longer = divmod(length, PIECES)
+    start = piece * short + max(0, piece - (PIECES - longer))
+    return start, start + short + (piece >= PIECES - longer)
+
+
+def _masked_key(word: str, length: int, start: int, after: int) -> str:
+    """
+    Return the index key of word with everything but its first start and
+    last after letters masked, as a match for surnames of the given length.
+    """
+    return f"{length}\0{word[:start]}\0{word[len(word) - after :]}"
+
+
+def masked_keys(folded: str) -> set[str]:
+    """Return the distinct index keys of a case-folded surname."""
+    length = len(folded)
+    keys = set()
+    for piece in range(PIECES):
+        start, end = _piece_bounds(length, piece)
+        keys.add(_masked_key(folded, length, start, length - end))
+    return keys
+
+
+def query_keys(folded: str) -> Iterator[tuple[str, int, int, str]]:
+    """
+    Yield the index keys that surnames within one edit of a query can have.
+
+    Each key comes as (key, start, end, middle): a surname stored under
+    the key matches if its piece [start:end] is within one edit of the
+    query's middle.
+
+    Args:
+        folded: case-folded query
+    """
+    for length in range(max(0, len(folded) - 1), len(folded) + 2):
+        for piece in range(PIECES):
+            start, end = _piece_bounds(length, piece)
+            after = length - end
+            if start + after <= len(folded):
+                key = _masked_key(folded, length, start, after)
+                yield key, start, end, folded[start : len(folded) - after]
+
+
+def within_one_edit(a: str, b: str) -> bool:
+    """
+    Return True if a and b differ by at most one edit.
+
+    An edit is an insertion, deletion or substitution of a letter, or a
+    swap of two adjacent letters. Meant for the short masked pieces.
+    """
+    if len(a) == len(b):
+        diffs = [i for i, (x, y) in enumerate(zip(a, b)) if x != y]
+        if len(diffs) < 2:
+            return True
+        first, second = diffs[0], diffs[-1]
+        return (
+            len(diffs) == 2
+            and second == first + 1
+            and a[first] == b[second]
+            and a[second] == b[first]
+        )
+    if len(a) > len(b):
+        a, b = b, a
+    if len(b) - len(a) != 1:
+        return False
+    return any(b[:i] + b[i + 1 :] == a for i in range(len(b)))
+
+
+class SurnameIndex:
+    """
+    Case-insensitive prefix and fuzzy (typo-tolerant) surname lookup.
+
+    Prefix queries use a sorted list of case-folded surnames and cost
+    O(log n + k). Fuzzy queries use a masked-piece index: every surname
+    is split into three pieces and indexed three times, each time with
+    one piece masked (its length and the text before and after it). A
+    surname one edit away from the query has the same key as the query
+    with the edited piece masked, so a query is nine dictionary lookups
+    plus a comparison of the masked pieces of the few candidates. A swap
+    of two adjacent letters counts as one edit, but is only found when
+    both letters are in the same piece.
+
+    This replaces a plain n-gram index: on a million surnames the
+    postings of common n-grams (such as "enko") are too large to
+    intersect in under a millisecond.
+    """
+
+    def __init__(self) -> None:
+        self._sorted: list[tuple[str, str]] = []
+        # masked key -> folded surname, or a set of them if shared
+        self._masked: dict[str, str | set[str]] = {}
+        # folded surname -> original surnames (usually just one)
+        self._surnames: dict[str, list[str]] = {}
+
+    def add(self, surname: str, ordered: bool = True) -> None:
+        """
+        Add a surname to the index.
+
+        Args:
+            surname: surname to add
+            ordered: keep the prefix list sorted; if False, call sort()
+                after a batch of additions
+        """
+        folded = surname.casefold()
+        if ordered:
+            insort(self._sorted, (folded, surname))
+        else:
+            self._sorted.append((folded, surname))
+        originals = self._surnames.setdefault(folded, [])
+        originals.append(surname)
+        if len(originals) > 1:
+            return
+        for key in masked_keys(folded):
+            members = self._masked.setdefault(key, folded)
+            if members is folded:
+                continue
+            if isinstance(members, str):
+                members = self._masked[key] = {members}
+            members.add(folded)
+
+    def remove(self, surname: str) -> None:
+        """Remove a surname from the index."""
+        folded = surname.casefold()
+        del self._sorted[bisect_left(self._sorted, (folded, surname))]
+        originals = self._surnames[folded]
+        originals.remove(surname)
+        if originals:
+            return
+        del self._surnames[folded]
+        for key in masked_keys(folded):
+            members = self._masked[key]
+            if isinstance(members, str):
+                del self._masked[key]
+                continue
+            members.discard(folded)
+            if len(members) == 1:
+                self._masked[key] = members.pop()
+
+    def sort(self) -> None:
+        """Restore the order of the prefix list after unordered additions."""
+        self._sorted.sort()
+
+    def prefix(self, prefix: str, limit: int = 10) -> list[str]:
+        """
+        Return up to limit surnames starting with prefix, in order.
+
+        Args:
+            prefix: beginning of the surname (case-insensitive)
+            limit: maximum number of surnames to return
+        """
+        folded = prefix.casefold()
+        start = bisect_left(self._sorted, (folded,))
+        result = []
+        for key, surname in self._sorted[start : start + limit]:
+            if not key.startswith(folded):
+                break
+            result.append(surname)
+        return result
+
+    def fuzzy(self, query: str, limit: int = 10) -> list[tuple[str, int]]:
+        """
+        Return up to limit (surname, edits) pairs within one edit of query.
+
+        Matches are ordered by the number of edits, then by surname.
+
+        Args:
+            query: surname to look for, possibly misspelled
+            limit: maximum number of surnames to return
+        """
+        folded = query.casefold()
+        # Candidates share a key with the query, so only the masked
+        # pieces need to be compared.
+        found: dict[str, int] = {}
+        for key, start, end, middle in query_keys(folded):
+            members = self._masked.get(key)
+            if members is None:
+                continue
+            if isinstance(members, str):
+                members = (members,)
+            for candidate in members:
+                if candidate not in found and within_one_edit(
+                    middle, candidate[start:end]
+                ):
+                    found[candidate] = int(candidate != folded)
+
+        matches = sorted(
+            (edits, surname)
+            for candidate, edits in found.items()
+            for surname in self._surnames[candidate]
+        )
+        return [(surname, edits) for edits, surname in matches[:limit]]
@@ -0,0 +1,77 @@
+import argparse
+import csv
+import os
+import tempfile
+import time
+
+from population_processor import (
+    aggregate_population_groups,
+    aggregate_population_parallel,
+    iter_csv_rows,
+)
+
+COUNTRIES = 500
+INDICATORS = 40
+YEARS = range(1960, 2024)
+
+
+def make_world_bank_csv(path: str, countries: int, indicators: int) -> int:
+    """Write a synthetic World Bank export and return its number of rows."""
+    rows = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["Country Name", "Country Code", "Indicator Name", "Year", "Population"]
+        )
+        for c in range(countries):
+            for i in range(indicators):
+                indicator = f"Indicator {i}, total"
+                for year in YEARS:
+                    value = (c + 1) * 1000 + (i + 1) * 10 + (year * 7919 + c) % 997
+                    writer.writerow([f"Country {c}", f"C{c}", indicator, year, value])
+                    rows += 1
+    return rows
+
+
+def summary(groups: dict) -> dict:
+    """Drop the float sums, which may differ in the last bits between orders."""
+    return {
+        key: {name: value for name, value in group.items() if name != "Sum"}
+        for key, group in groups.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel CSV aggregation")
+    parser.add_argument("--countries", type=int, default=COUNTRIES)
+    parser.add_argument("--indicators", type=int, default=INDICATORS)
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cpus})
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "population.csv")
+        rows = make_world_bank_csv(path, args.countries, args.indicators)
+        size = os.path.getsize(path) / 2**20
+        print(f"{rows:,} rows, {size:.0f} MB, {cpus} CPUs")
+
+        start = time.perf_counter()
+        expected = aggregate_population_groups(iter_csv_rows(path))
+        sequential = time.perf_counter() - start
+        print(
+            f"{'sequential':>12}: {sequential:6.2f} s  {rows / sequential:>12,.0f} rows/s"
+        )
+
+        for workers in worker_counts:
+            start = time.perf_counter()
+            groups = aggregate_population_parallel(path, workers)
+            elapsed = time.perf_counter() - start
+            assert summary(groups) == summary(expected)
+            print(
+                f"{workers:>4} workers: {elapsed:6.2f} s  {rows / elapsed:>12,.0f} rows/s"
+                f"  {sequential / elapsed:.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import argparse
+import random
+import time
+
+from students_search_index import StudentsSearchIndex
+
+STUDENTS = 1_000_000
+REPEATS = 5
+FIRST_NAMES = [
+    "Andriy", "Bohdan", "Dmytro", "Ivan", "Mykola", "Oleh", "Petro", "Taras",
+    "Anna", "Daryna", "Iryna", "Kateryna", "Olena", "Oksana", "Sofiia", "Yuliia",
+]  # fmt: skip
+LAST_NAMES = [
+    "Bondarenko", "Boyko", "Hrytsenko", "Ivanenko", "Kovalenko", "Kravchenko",
+    "Melnyk", "Moroz", "Petrenko", "Shevchenko", "Tkachenko", "Zinchenko",
+]  # fmt: skip
+
+
+def make_students(count: int) -> list:
+    """Build a synthetic students list, sorted as students_height_processor keeps it."""
+    rng = random.Random(42)
+    data = [
+        {
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}",
+            "gender": rng.choice(("male", "female")),
+            "height": rng.randint(1400, 2100) / 10,
+        }
+        for i in range(count)
+    ]
+    data.sort(key=lambda x: x["height"], reverse=True)
+    return data
+
+
+def timed(func) -> tuple:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indexed student search")
+    parser.add_argument("--students", type=int, default=STUDENTS)
+    args = parser.parse_args()
+
+    data = make_students(args.students)
+    start = time.perf_counter()
+    index = StudentsSearchIndex(data)
+    print(f"{len(data):,} students, index built in {time.perf_counter() - start:.1f} s")
+
+    cases = [
+        (
+            "name 'kovalenko 12'",
+            lambda: [s for s in data if "kovalenko 12" in s["name"].lower()],
+            lambda: index.by_name("kovalenko 12"),
+        ),
+        (
+            "name '777'",
+            lambda: [s for s in data if "777" in s["name"].lower()],
+            lambda: index.by_name("777"),
+        ),
+        (
+            "name '99'",
+            lambda: [s for s in data if "99" in s["name"].lower()],
+            lambda: index.by_name("99"),
+        ),
+        (
+            "gender female",
+            lambda: [s for s in data if s["gender"] == "female"],
+            lambda: index.by_gender("female"),
+        ),
+        (
+            "height 172.3",
+            lambda: [s for s in data if s["height"] == 172.3],
+            lambda: index.by_height(172.3),
+        ),
+        (
+            "height 180-180.5",
+            lambda: [s for s in data if 180 <= s["height"] <= 180.5],
+            lambda: index.by_height_range(180, 180.5),
+        ),
+    ]
+    print(f"{'query':<20} | {'results':>8} | {'scan':>10} | {'index':>10} | speedup")
+    print("-" * 66)
+    for name, scan, indexed in cases:
+        scan_time, expected = timed(scan)
+        index_time, results = timed(indexed)
+        assert results == expected, name
+        print(
+            f"{name:<20} | {len(results):>8,} | {scan_time * 1e3:>7.1f} ms | "
+            f"{index_time * 1e3:>7.2f} ms | {scan_time / index_time:.0f}x"
+        )
+
+    student = {"name": "New Student", "gender": "female", "height": 172.3}
+    start = time.perf_counter()
+    index.add(student)
+    index.remove(student)
+    print(f"add + remove: {(time.perf_counter() - start) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+from fractions import Fraction
+from typing import Any, Dict, Iterable
+
+GENDERS = ("female", "male")
+
+
+class HeightTotals:
+    """
+    Per-gender height sums and counts, kept up to date on add and remove.
+
+    Sums are exact fractions, so adding and removing the same students
+    in any order leaves no rounding drift, and comparison() costs O(1)
+    however many students there are.
+
+    Args:
+        data: students to start from
+    """
+
+    def __init__(self, data: Iterable[Dict[str, Any]] = ()) -> None:
+        self._sums = {gender: Fraction(0) for gender in GENDERS}
+        self._counts = {gender: 0 for gender in GENDERS}
+        self.extend(data)
+
+    def add(self, student: Dict[str, Any]) -> None:
+        gender = student["gender"]
+        if gender in self._sums:
+            self._sums[gender] += Fraction(student["height"])
+            self._counts[gender] += 1
+
+    def extend(self, students: Iterable[Dict[str, Any]]) -> None:
+        for student in students:
+            self.add(student)
+
+    def remove(self, student: Dict[str, Any]) -> None:
+        gender = student["gender"]
+        if gender in self._sums:
+            self._sums[gender] -= Fraction(student["height"])
+            self._counts[gender] -= 1
+
+    def comparison(self) -> Dict[str, Any]:
+        girls_height = self._sums["female"]
+        boys_height = self._sums["male"]
+        return {
+            "total_girls_height": float(girls_height),
+            "total_boys_height": float(boys_height),
+            "girls_exceed_boys": girls_height > boys_height,
+            "difference": float(abs(girls_height - boys_height)),
+            "girls_count": self._counts["female"],
+            "boys_count": self._counts["male"],
+        }
@@ -0,0 +1,183 @@
+import csv
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+CACHE_DIR_NAME = ".population_cache"
+MAGIC = b"POPCOLS1"
+# Column name -> array typecode, in file order.
+COLUMNS = [("country", "I"), ("indicator", "I"), ("year", "i"), ("population", "d")]
+ALIGNMENT = 8
+
+
+def cache_path_for(source: str, cache_dir: Optional[str] = None) -> str:
+    # One cache file per source path, in a directory next to the source.
+    source = os.path.abspath(source)
+    cache_dir = cache_dir or os.path.join(os.path.dirname(source), CACHE_DIR_NAME)
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.basename(source)}.{digest}.cols")
+
+
+def source_key(source: str) -> Dict[str, object]:
+    stat = os.stat(source)
+    return {
+        "source": os.path.abspath(source),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def build_population_cache(source: str, cache_path: str) -> None:
+    # Parses the CSV once; rows whose Year or Population do not parse are
+    # left out, as every consumer skips them anyway.
+    key = source_key(source)
+    columns = {name: array(typecode) for name, typecode in COLUMNS}
+    countries: Dict[str, int] = {}
+    indicators: Dict[str, int] = {}
+
+    with open(source, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                year = int(row.get("Year", "").strip())
+                population = float(row.get("Population", "").strip())
+            except (ValueError, TypeError, AttributeError):
+                continue
+            country = row.get("Country Name", "").strip()
+            indicator = row.get("Indicator Name", "").strip()
+            columns["country"].append(countries.setdefault(country, len(countries)))
+            columns["indicator"].append(
+                indicators.setdefault(indicator, len(indicators))
+            )
+            columns["year"].append(year)
+            columns["population"].append(population)
+
+    header = json.dumps(
+        {
+            **key,
+            "byteorder": sys.byteorder,
+            "rows": len(columns["year"]),
+            "countries": list(countries),
+            "indicators": list(indicators),
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for name, _ in COLUMNS:
+            f.write(b"\0" * (-f.tell() % ALIGNMENT))
+            columns[name].tofile(f)
+    os.replace(tmp_path, cache_path)
+
+
+class PopulationColumns:
+    """
+    Parsed population rows, read from a memory-mapped columnar cache file.
+
+    The file holds a JSON header (source key, row count and the country
+    and indicator dictionaries) followed by one typed array per column:
+    country and indicator ids, years and populations. Columns are
+    exposed as memoryviews over the mapping, so opening the cache costs
+    the header only and no text is parsed.
+
+    Args:
+        cache_path: path of a file written by build_population_cache
+    """
+
+    def __init__(self, cache_path: str) -> None:
+        self._file = open(cache_path, "rb")
+        self._views: Dict[str, memoryview] = {}
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._open_columns(cache_path)
+        except Exception:
+            self.close()
+            raise
+
+    def _open_columns(self, cache_path: str) -> None:
+        if self._map[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{cache_path} is not a population cache file.")
+
+        (header_size,) = struct.unpack_from("<I", self._map, len(MAGIC))
+        offset = len(MAGIC) + 4
+        self.header = json.loads(self._map[offset : offset + header_size])
+        self.countries: List[str] = self.header["countries"]
+        self.indicators: List[str] = self.header["indicators"]
+        rows = self.header["rows"]
+
+        offset += header_size
+        for name, typecode in COLUMNS:
+            offset += -offset % ALIGNMENT
+            size = rows * array(typecode).itemsize
+            if offset + size > len(self._map):
+                raise ValueError(f"{cache_path} is truncated.")
+            view = memoryview(self._map)[offset : offset + size]
+            self._views[name] = view.cast(typecode)
+            view.release()
+            offset += size
+
+    def __len__(self) -> int:
+        return self.header["rows"]
+
+    def close(self) -> None:
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        if hasattr(self, "_map"):
+            self._map.close()
+        self._file.close()
+
+    def iter_points(self) -> Iterator[Tuple[str, str, int, float]]:
+        countries, indicators = self.countries, self.indicators
+        views = self._views
+        for country, indicator, year, population in zip(
+            views["country"], views["indicator"], views["year"], views["population"]
+        ):
+            yield countries[country], indicators[indicator], year, population
+
+    def iter_series(self, country: str, indicator: str) -> Iterator[Tuple[int, float]]:
+        # Only integer ids are compared per row.
+        try:
+            country_id = self.countries.index(country)
+            indicator_id = self.indicators.index(indicator)
+        except ValueError:
+            return
+        views = self._views
+        for row_country, row_indicator, year, population in zip(
+            views["country"], views["indicator"], views["year"], views["population"]
+        ):
+            if row_country == country_id and row_indicator == indicator_id:
+                yield year, population
+
+
+def load_population_columns(
+    source: str, cache_dir: Optional[str] = None
+) -> PopulationColumns:
+    # Reuses the cache while the source path, size and mtime match;
+    # otherwise the CSV is parsed again and the cache rewritten.
+    cache_path = cache_path_for(source, cache_dir)
+    key = source_key(source)
+    if os.path.exists(cache_path):
+        try:
+            columns = PopulationColumns(cache_path)
+        except (ValueError, KeyError, struct.error):
+            columns = None
+        if columns is not None:
+            header = columns.header
+            if header["byteorder"] == sys.byteorder and all(
+                header[name] == value for name, value in key.items()
+            ):
+                return columns
+            columns.close()
+
+    build_population_cache(source, cache_path)
+    return PopulationColumns(cache_path)
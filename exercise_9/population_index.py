@@ -0,0 +1,237 @@
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+from population_cache import source_key
+
+INDEX_SUFFIX = ".idx"
+MAGIC = b"POPIDX01"
+ALIGNMENT = 8
+# A key packs (country id, indicator id, year) into one unsigned 64-bit
+# integer, so the sorted keys can be searched with bisect directly.
+INDICATOR_BITS = 20
+YEAR_BITS = 20
+YEAR_BIAS = 1 << (YEAR_BITS - 1)
+
+
+def index_path_for(source: str) -> str:
+    return source + INDEX_SUFFIX
+
+
+def pack_key(country_id: int, indicator_id: int, year: int) -> int:
+    if not -YEAR_BIAS <= year < YEAR_BIAS:
+        raise ValueError(f"Year {year} is out of range.")
+    return (
+        (country_id << (INDICATOR_BITS + YEAR_BITS))
+        | (indicator_id << YEAR_BITS)
+        | (year + YEAR_BIAS)
+    )
+
+
+def build_population_index(source: str, index_path: Optional[str] = None) -> None:
+    # Records the byte offset of every row with a parseable Year. Like
+    # find_chunk_ranges, assumes no quoted field spans lines. When a key
+    # occurs more than once, the first row wins.
+    index_path = index_path or index_path_for(source)
+    key = source_key(source)
+    countries: Dict[str, int] = {}
+    indicators: Dict[str, int] = {}
+    entries = []
+
+    with open(source, "rb") as f:
+        header = f.readline()
+        fieldnames = next(csv.reader([header.decode("utf-8-sig")]))
+        columns = {name: i for i, name in enumerate(fieldnames)}
+        country_col = columns["Country Name"]
+        indicator_col = columns["Indicator Name"]
+        year_col = columns["Year"]
+
+        offset = f.tell()
+        for line in f:
+            row_offset = offset
+            offset += len(line)
+            values = next(csv.reader([line.decode("utf-8")]), None)
+            if not values or len(values) <= max(country_col, indicator_col, year_col):
+                continue
+            try:
+                year = int(values[year_col].strip())
+            except ValueError:
+                continue
+            country = values[country_col].strip()
+            indicator = values[indicator_col].strip()
+            country_id = countries.setdefault(country, len(countries))
+            indicator_id = indicators.setdefault(indicator, len(indicators))
+            entries.append((pack_key(country_id, indicator_id, year), row_offset))
+
+    if len(indicators) >= 1 << INDICATOR_BITS:
+        raise ValueError("Too many indicators to index.")
+    entries.sort()  # stable, so equal keys keep file order
+    keys = array("Q")
+    offsets = array("Q")
+    for entry_key, row_offset in entries:
+        if keys and keys[-1] == entry_key:
+            continue
+        keys.append(entry_key)
+        offsets.append(row_offset)
+
+    header_bytes = json.dumps(
+        {
+            **key,
+            "byteorder": sys.byteorder,
+            "rows": len(keys),
+            "fieldnames": fieldnames,
+            "countries": list(countries),
+            "indicators": list(indicators),
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        for column in (keys, offsets):
+            f.write(b"\0" * (-f.tell() % ALIGNMENT))
+            column.tofile(f)
+    os.replace(tmp_path, index_path)
+
+
+class PopulationIndex:
+    """
+    Point lookups into a population CSV through a byte-offset sidecar.
+
+    The sidecar holds a JSON header (source key, CSV field names and the
+    country and indicator dictionaries) followed by two arrays: sorted
+    packed (country, indicator, year) keys and the byte offset of the
+    matching row. Both the sidecar and the CSV are memory-mapped, so a
+    lookup is a binary search over the keys plus parsing a single line,
+    whatever the size of the file.
+
+    Args:
+        source: path of the CSV file
+        index_path: sidecar written by build_population_index
+    """
+
+    def __init__(self, source: str, index_path: Optional[str] = None) -> None:
+        index_path = index_path or index_path_for(source)
+        self._files = []
+        self._maps: List[mmap.mmap] = []
+        self._keys: Optional[memoryview] = None
+        self._offsets: Optional[memoryview] = None
+        try:
+            index = self._map_file(index_path)
+            self._source = self._map_file(source)
+            self._open_index(index, index_path)
+        except Exception:
+            self.close()
+            raise
+
+    def _map_file(self, path: str) -> mmap.mmap:
+        f = open(path, "rb")
+        self._files.append(f)
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return mapped
+
+    def _open_index(self, index: mmap.mmap, index_path: str) -> None:
+        if index[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{index_path} is not a population index file.")
+
+        (header_size,) = struct.unpack_from("<I", index, len(MAGIC))
+        offset = len(MAGIC) + 4
+        self.header = json.loads(index[offset : offset + header_size])
+        self.fieldnames: List[str] = self.header["fieldnames"]
+        self._countries = {name: i for i, name in enumerate(self.header["countries"])}
+        self._indicators = {name: i for i, name in enumerate(self.header["indicators"])}
+        size = self.header["rows"] * 8
+
+        offset += header_size
+        views = []
+        for _ in range(2):
+            offset += -offset % ALIGNMENT
+            if offset + size > len(index):
+                raise ValueError(f"{index_path} is truncated.")
+            view = memoryview(index)[offset : offset + size]
+            views.append(view.cast("Q"))
+            view.release()
+            offset += size
+        self._keys, self._offsets = views
+
+    def __len__(self) -> int:
+        return self.header["rows"]
+
+    def close(self) -> None:
+        for view in (self._keys, self._offsets):
+            if view is not None:
+                view.release()
+        self._keys = self._offsets = None
+        for mapped in self._maps:
+            mapped.close()
+        for f in self._files:
+            f.close()
+        self._maps, self._files = [], []
+
+    def _find(self, country: str, indicator: str, year: int) -> Optional[int]:
+        country_id = self._countries.get(country)
+        indicator_id = self._indicators.get(indicator)
+        if country_id is None or indicator_id is None:
+            return None
+        try:
+            key = pack_key(country_id, indicator_id, year)
+        except ValueError:
+            return None
+        i = bisect_left(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            return None
+        return self._offsets[i]
+
+    def lookup(
+        self, country: str, indicator: str, year: int
+    ) -> Optional[Dict[str, str]]:
+        """Return the CSV row for (country, indicator, year), or None."""
+        offset = self._find(country, indicator, year)
+        if offset is None:
+            return None
+        end = self._source.find(b"\n", offset)
+        line = self._source[offset : end if end != -1 else len(self._source)]
+        values = next(csv.reader([line.decode("utf-8")]))
+        return dict(zip(self.fieldnames, values))
+
+    def population(self, country: str, indicator: str, year: int) -> Optional[float]:
+        """Return the Population value for (country, indicator, year), or None."""
+        row = self.lookup(country, indicator, year)
+        if row is None:
+            return None
+        try:
+            return float(row.get("Population", "").strip())
+        except ValueError:
+            return None
+
+
+def load_population_index(source: str) -> PopulationIndex:
+    # Reuses the sidecar while the source path, size and mtime match;
+    # otherwise the offsets are recorded again.
+    index_path = index_path_for(source)
+    key = source_key(source)
+    if os.path.exists(index_path):
+        try:
+            index = PopulationIndex(source, index_path)
+        except (ValueError, KeyError, struct.error):
+            index = None
+        if index is not None:
+            header = index.header
+            if header["byteorder"] == sys.byteorder and all(
+                header[name] == value for name, value in key.items()
+            ):
+                return index
+            index.close()
+
+    build_population_index(source, index_path)
+    return PopulationIndex(source, index_path)
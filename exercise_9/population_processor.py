@@ -1,5 +1,34 @@
+import argparse
 import csv
-from typing import List, Dict, Union
+import os
+import random
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from population_cache import PopulationColumns, load_population_columns
+from population_index import load_population_index
+
+OUTPUT_FILENAME = "ukraine_population_results.csv"
+GROUPS_OUTPUT_FILENAME = "population_groups_results.csv"
+DISPLAY_MODES = ("head", "tail", "sample")
+DISPLAY_LIMIT = 50
+MAX_COLUMN_WIDTH = 40
+WIDTH_SAMPLE_ROWS = 1000
+WRITE_BUFFER_LINES = 1000
 
 
 def read_csv_file(filename: str) -> List[Dict[str, str]]:
@@ -15,24 +44,142 @@ def read_csv_file(filename: str) -> List[Dict[str, str]]:
     return data
 
 
-def display_csv_content(data: List[Dict[str, str]]) -> None:
-    if not data:
-        print("No data to display.")
-        return
+def iter_csv_rows(filename: str) -> Iterator[Dict[str, str]]:
+    # Rows are read one at a time, so memory does not grow with the file.
+    try:
+        with open(filename, "r", encoding="utf-8", newline="") as f:
+            yield from csv.DictReader(f)
+    except OSError as e:
+        print(f"Error reading file {filename}: {e}")
+        raise
 
-    print("\n" + "=" * 80)
-    print("CSV File Content:")
-    print("=" * 80)
 
-    headers = list(data[0].keys())
-    print(" | ".join(headers))
-    print("-" * 80)
+def select_display_rows(
+    rows: Iterable[Dict[str, str]],
+    mode: str = "head",
+    limit: Optional[int] = DISPLAY_LIMIT,
+    seed: Optional[int] = None,
+) -> Tuple[List[Dict[str, str]], Optional[int]]:
+    # Returns the rows to show and the total row count when it is known.
+    # Lists are sliced or sampled by index, so only the shown rows are
+    # touched; other iterables are consumed keeping at most limit rows.
+    if mode not in DISPLAY_MODES:
+        raise ValueError(f"Unknown display mode: {mode}")
+    if limit is None:
+        selected = list(rows)
+        return selected, len(selected)
 
-    for row in data:
-        values = [str(row.get(header, "")) for header in headers]
-        print(" | ".join(values))
+    if isinstance(rows, Sequence):
+        total = len(rows)
+        if mode == "head":
+            return list(rows[:limit]), total
+        if mode == "tail":
+            return list(rows[max(total - limit, 0) :]), total
+        picked = sorted(random.Random(seed).sample(range(total), min(limit, total)))
+        return [rows[i] for i in picked], total
 
-    print("=" * 80)
+    if mode == "head":
+        return list(islice(rows, limit)), None
+    if mode == "tail":
+        total = 0
+        window: deque = deque(maxlen=limit)
+        for row in rows:
+            window.append(row)
+            total += 1
+        return list(window), total
+
+    # Reservoir sampling keeps file order for the rows that survive.
+    rng = random.Random(seed)
+    reservoir: List[Tuple[int, Dict[str, str]]] = []
+    total = 0
+    for i, row in enumerate(rows):
+        total += 1
+        if len(reservoir) < limit:
+            reservoir.append((i, row))
+        else:
+            j = rng.randrange(i + 1)
+            if j < limit:
+                reservoir[j] = (i, row)
+    reservoir.sort(key=lambda item: item[0])
+    return [row for _, row in reservoir], total
+
+
+def clip_cell(text: str, max_width: int) -> str:
+    text = text.replace("\n", " ")
+    if len(text) > max_width:
+        text = text[: max_width - 1] + "…"
+    return text
+
+
+def render_table(
+    rows: List[Dict[str, str]],
+    out: TextIO,
+    max_width: int = MAX_COLUMN_WIDTH,
+    width_sample: int = WIDTH_SAMPLE_ROWS,
+) -> None:
+    # Column widths come from the first width_sample rows only, capped at
+    # max_width; a longer cell later on just pushes its line out of
+    # alignment. Lines are written in blocks rather than one print() per
+    # row.
+    headers = list(rows[0].keys())
+    widths = [len(header) for header in headers]
+    for row in islice(rows, width_sample):
+        for i, header in enumerate(headers):
+            widths[i] = max(widths[i], len(str(row.get(header, ""))))
+    widths = [min(width, max_width) for width in widths]
+    template = " | ".join(f"{{:<{width}}}" for width in widths)
+
+    lines = [
+        template.format(*(clip_cell(h, max_width) for h in headers)).rstrip(),
+        "-+-".join("-" * width for width in widths),
+    ]
+    for row in rows:
+        cells = [str(row.get(header, "")) for header in headers]
+        if any(len(cell) > max_width or "\n" in cell for cell in cells):
+            cells = [clip_cell(cell, max_width) for cell in cells]
+        lines.append(template.format(*cells).rstrip())
+        if len(lines) >= WRITE_BUFFER_LINES:
+            out.write("\n".join(lines) + "\n")
+            lines = []
+    if lines:
+        out.write("\n".join(lines) + "\n")
+
+
+def display_csv_content(
+    data: Iterable[Dict[str, str]],
+    mode: str = "head",
+    limit: Optional[int] = DISPLAY_LIMIT,
+    out: Optional[TextIO] = None,
+) -> None:
+    out = out or sys.stdout
+    rows, total = select_display_rows(data, mode, limit)
+    if not rows:
+        out.write("No data to display.\n")
+        return
+
+    out.write("\n" + "=" * 80 + "\nCSV File Content:\n" + "=" * 80 + "\n")
+    render_table(rows, out)
+    if total is None:
+        out.write(f"({len(rows)} rows shown, {mode})\n")
+    elif total > len(rows):
+        out.write(f"({len(rows)} of {total} rows shown, {mode})\n")
+    out.write("=" * 80 + "\n")
+    out.flush()
+
+
+def preview_csv_file(
+    filename: str,
+    mode: str = "head",
+    limit: Optional[int] = DISPLAY_LIMIT,
+    out: Optional[TextIO] = None,
+) -> None:
+    # Displays rows straight from the file: a head preview reads only
+    # limit rows, tail and sample keep at most limit rows in memory.
+    rows = iter_csv_rows(filename)
+    try:
+        display_csv_content(rows, mode, limit, out)
+    finally:
+        rows.close()
 
 
 def find_ukraine_population_data(
@@ -42,9 +189,17 @@ def find_ukraine_population_data(
     start_year: int = 1991,
     end_year: int = 2019,
 ) -> List[Dict[str, Union[str, float]]]:
-    result: List[Dict[str, Union[str, float]]] = []
+    return list(filter_population_rows(data, indicator, country, start_year, end_year))
+
 
-    for row in data:
+def filter_population_rows(
+    rows: Iterable[Dict[str, str]],
+    indicator: str = "Population, total",
+    country: str = "Ukraine",
+    start_year: int = 1991,
+    end_year: int = 2019,
+) -> Iterator[Dict[str, Union[str, float]]]:
+    for row in rows:
         if (
             row.get("Country Name", "").strip() == country
             and row.get("Indicator Name", "").strip() == indicator
@@ -57,18 +212,32 @@ def find_ukraine_population_data(
                     year = int(year_str)
                     if start_year <= year <= end_year:
                         population = float(population_str)
-                        result.append(
-                            {
-                                "Year": year_str,
-                                "Population": population,
-                                "Country": country,
-                                "Indicator": indicator,
-                            }
-                        )
+                        yield {
+                            "Year": year_str,
+                            "Population": population,
+                            "Country": country,
+                            "Indicator": indicator,
+                        }
                 except (ValueError, TypeError):
                     continue
 
-    return result
+
+def iter_cached_population_records(
+    columns: PopulationColumns,
+    indicator: str = "Population, total",
+    country: str = "Ukraine",
+    start_year: int = 1991,
+    end_year: int = 2019,
+) -> Iterator[Dict[str, Union[str, float]]]:
+    # Same records as filter_population_rows, read from the columnar cache.
+    for year, population in columns.iter_series(country, indicator):
+        if start_year <= year <= end_year:
+            yield {
+                "Year": str(year),
+                "Population": population,
+                "Country": country,
+                "Indicator": indicator,
+            }
 
 
 def find_min_max_values(
@@ -80,9 +249,246 @@ def find_min_max_values(
     return {"min": min_record, "max": max_record}
 
 
+def stream_min_max(
+    records: Iterable[Dict[str, Union[str, float]]],
+) -> Optional[Dict[str, Union[Dict[str, Union[str, float]], int]]]:
+    # Keeps only the current minimum and maximum (the first one on ties,
+    # like min() and max()), so any number of records fits in O(1) memory.
+    min_record = max_record = None
+    count = 0
+    for record in records:
+        count += 1
+        if min_record is None or record["Population"] < min_record["Population"]:
+            min_record = record
+        if max_record is None or record["Population"] > max_record["Population"]:
+            max_record = record
+
+    if min_record is None:
+        return None
+    return {"min": min_record, "max": max_record, "count": count}
+
+
+GroupKey = Tuple[str, str]
+# (year, value) pair
+Point = Tuple[int, float]
+
+
+def new_population_group() -> Dict[str, Any]:
+    return {
+        "Count": 0,
+        "Sum": 0.0,
+        "Min": None,
+        "Max": None,
+        "First": None,
+        "Last": None,
+        # The point before "Last", for the year-over-year change.
+        "Previous": None,
+    }
+
+
+def update_population_group(group: Dict[str, Any], year: int, value: float) -> None:
+    group["Count"] += 1
+    group["Sum"] += value
+    point = (year, value)
+    if group["Last"] is None:
+        group["Min"] = group["Max"] = group["First"] = group["Last"] = point
+        return
+    update_extremes(group, point)
+    update_latest(group, point)
+
+
+def update_extremes(group: Dict[str, Any], point: Point) -> None:
+    year, value = point
+    # Ties go to the earliest year.
+    if (value, year) < (group["Min"][1], group["Min"][0]):
+        group["Min"] = point
+    if (value, -year) > (group["Max"][1], -group["Max"][0]):
+        group["Max"] = point
+    if year < group["First"][0]:
+        group["First"] = point
+
+
+def update_latest(group: Dict[str, Any], point: Point) -> None:
+    # Keeps the two latest distinct years in "Last" and "Previous".
+    year = point[0]
+    if year > group["Last"][0]:
+        group["Previous"], group["Last"] = group["Last"], point
+    elif year < group["Last"][0] and (
+        group["Previous"] is None or year > group["Previous"][0]
+    ):
+        group["Previous"] = point
+
+
+def aggregate_population_groups(
+    rows: Iterable[Dict[str, str]],
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+) -> Dict[GroupKey, Dict[str, Any]]:
+    return aggregate_population_points(
+        parse_population_rows(rows), start_year, end_year
+    )
+
+
+def parse_population_rows(
+    rows: Iterable[Dict[str, str]],
+) -> Iterator[Tuple[str, str, int, float]]:
+    for row in rows:
+        try:
+            year = int(row.get("Year", "").strip())
+            value = float(row.get("Population", "").strip())
+        except (ValueError, TypeError, AttributeError):
+            continue
+        yield (
+            row.get("Country Name", "").strip(),
+            row.get("Indicator Name", "").strip(),
+            year,
+            value,
+        )
+
+
+def aggregate_population_points(
+    points: Iterable[Tuple[str, str, int, float]],
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+) -> Dict[GroupKey, Dict[str, Any]]:
+    # One pass over all (country, indicator, year, value) points; every
+    # (country, indicator) pair gets its own running aggregates, so the
+    # size of the result does not depend on the number of rows and the
+    # rows may come in any order.
+    groups: Dict[GroupKey, Dict[str, Any]] = {}
+    for country, indicator, year, value in points:
+        if start_year is not None and year < start_year:
+            continue
+        if end_year is not None and year > end_year:
+            continue
+        group = groups.get((country, indicator))
+        if group is None:
+            group = groups[(country, indicator)] = new_population_group()
+        update_population_group(group, year, value)
+    return groups
+
+
+def merge_population_groups(
+    into: Dict[GroupKey, Dict[str, Any]], other: Dict[GroupKey, Dict[str, Any]]
+) -> Dict[GroupKey, Dict[str, Any]]:
+    # Partial aggregates of different parts of a file combine into the
+    # aggregates of the whole file.
+    for key, group in other.items():
+        target = into.get(key)
+        if target is None:
+            into[key] = group
+            continue
+        target["Count"] += group["Count"]
+        target["Sum"] += group["Sum"]
+        for point in (group["Min"], group["Max"], group["First"]):
+            update_extremes(target, point)
+        for point in (group["Previous"], group["Last"]):
+            if point is not None:
+                update_latest(target, point)
+    return into
+
+
+def find_chunk_ranges(
+    filename: str, chunks: int
+) -> Tuple[List[str], List[Tuple[int, int]]]:
+    # Splits the data rows (after the header) into byte ranges that start
+    # and end on line boundaries. Assumes no quoted field spans lines,
+    # which holds for World Bank exports.
+    with open(filename, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+        size = os.fstat(f.fileno()).st_size
+        bounds = [data_start]
+        for i in range(1, chunks):
+            f.seek(max(data_start + (size - data_start) * i // chunks, bounds[-1]))
+            if f.tell() > data_start:
+                f.readline()  # finish the line the split point fell into
+            bounds.append(max(f.tell(), bounds[-1]))
+        bounds.append(size)
+
+    fieldnames = next(csv.reader([header.decode("utf-8-sig")]))
+    ranges = [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+    return fieldnames, ranges
+
+
+def aggregate_chunk(
+    filename: str,
+    fieldnames: List[str],
+    start: int,
+    end: int,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+) -> Dict[GroupKey, Dict[str, Any]]:
+    def lines():
+        position = start
+        with open(filename, "rb") as f:
+            f.seek(start)
+            for line in f:
+                if position >= end:
+                    break
+                position += len(line)
+                yield line.decode("utf-8")
+
+    rows = csv.DictReader(lines(), fieldnames=fieldnames)
+    return aggregate_population_groups(rows, start_year, end_year)
+
+
+def aggregate_population_parallel(
+    filename: str,
+    workers: Optional[int] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+) -> Dict[GroupKey, Dict[str, Any]]:
+    # Each worker process parses and aggregates its own byte ranges; only
+    # the small per-group partial aggregates are sent back and merged.
+    workers = workers or os.cpu_count() or 1
+    fieldnames, ranges = find_chunk_ranges(filename, workers * 4)
+    groups: Dict[GroupKey, Dict[str, Any]] = {}
+    with ProcessPoolExecutor(workers) as pool:
+        partials = [
+            pool.submit(
+                aggregate_chunk, filename, fieldnames, start, end, start_year, end_year
+            )
+            for start, end in ranges
+        ]
+        for partial in partials:
+            merge_population_groups(groups, partial.result())
+    return groups
+
+
+def population_group_rows(
+    key: GroupKey, group: Dict[str, Any]
+) -> List[Dict[str, Union[str, float]]]:
+    country, indicator = key
+    first, last, previous = group["First"], group["Last"], group["Previous"]
+    rows = [
+        ("Minimum", group["Min"][0], group["Min"][1]),
+        ("Maximum", group["Max"][0], group["Max"][1]),
+        ("Mean", f"{first[0]}-{last[0]}", group["Sum"] / group["Count"]),
+        ("First", first[0], first[1]),
+        ("Last", last[0], last[1]),
+    ]
+    if previous is not None:
+        rows.append(("Year-over-year change", last[0], last[1] - previous[1]))
+    return [
+        {
+            "Type": row_type,
+            "Year": str(year),
+            "Population": value,
+            "Country": country,
+            "Indicator": indicator,
+        }
+        for row_type, year, value in rows
+    ]
+
+
 def write_results_to_csv(
-    results: Dict[str, Dict[str, Union[str, float]]], output_filename: str
+    results: Optional[Dict[str, Dict[str, Union[str, float]]]],
+    output_filename: str,
+    groups: Optional[Dict[GroupKey, Dict[str, Any]]] = None,
 ) -> None:
+    # results is one min/max pair; groups (see aggregate_population_groups)
+    # adds min, max, mean, first, last and year-over-year rows per group.
     try:
         with open(output_filename, "w", encoding="utf-8", newline="") as f:
             writer = csv.DictWriter(
@@ -90,13 +496,17 @@ def write_results_to_csv(
             )
             writer.writeheader()
 
-            min_row = results["min"].copy()
-            min_row["Type"] = "Minimum"
-            writer.writerow(min_row)
+            if results:
+                min_row = results["min"].copy()
+                min_row["Type"] = "Minimum"
+                writer.writerow(min_row)
+
+                max_row = results["max"].copy()
+                max_row["Type"] = "Maximum"
+                writer.writerow(max_row)
 
-            max_row = results["max"].copy()
-            max_row["Type"] = "Maximum"
-            writer.writerow(max_row)
+            for key, group in (groups or {}).items():
+                writer.writerows(population_group_rows(key, group))
 
         print(f"\nResults written to {output_filename} successfully.")
     except OSError as e:
@@ -104,32 +514,213 @@ def write_results_to_csv(
         raise
 
 
-def main():
-    input_filename = "population_data.csv"
-    output_filename = "ukraine_population_results.csv"
+def print_min_max(min_max: Dict[str, Dict[str, Union[str, float]]]) -> None:
+    print("\n" + "=" * 60)
+    print("RESULTS:")
+    print("=" * 60)
+    print(
+        f"Minimum Population: {min_max['min']['Population']:,.0f} in {min_max['min']['Year']}"
+    )
+    print(
+        f"Maximum Population: {min_max['max']['Population']:,.0f} in {min_max['max']['Year']}"
+    )
+    print("=" * 60)
+
+
+def run_streaming_pipeline(args: argparse.Namespace) -> None:
+    # One lazy pass: rows are filtered as they are read and only the
+    # current min/max records are kept. The head preview reads only the
+    # first args.limit rows.
+    preview_csv_file(args.input, "head", args.limit)
+    if args.cache:
+        columns = load_population_columns(args.input)
+        try:
+            min_max = stream_min_max(
+                iter_cached_population_records(
+                    columns,
+                    args.indicator,
+                    args.country,
+                    args.start_year,
+                    args.end_year,
+                )
+            )
+        finally:
+            columns.close()
+    else:
+        records = filter_population_rows(
+            iter_csv_rows(args.input),
+            args.indicator,
+            args.country,
+            args.start_year,
+            args.end_year,
+        )
+        min_max = stream_min_max(records)
+    if min_max is None:
+        print(f"No data points for {args.country} ({args.start_year}-{args.end_year}).")
+        return
 
+    print(
+        f"\nFound {min_max['count']} data points for {args.country} "
+        f"({args.start_year}-{args.end_year})."
+    )
+    print_min_max(min_max)
+    write_results_to_csv(min_max, args.output)
+
+
+def run_point_lookup(args: argparse.Namespace) -> None:
+    # Seeks straight to one row through the byte-offset sidecar index.
+    index = load_population_index(args.input)
     try:
-        csv_data = read_csv_file(input_filename)
-        display_csv_content(csv_data)
+        population = index.population(args.country, args.indicator, args.year)
+    finally:
+        index.close()
+    if population is None:
+        print(f"No data for {args.country}, {args.indicator}, {args.year}.")
+    else:
+        print(f"{args.country}, {args.indicator}, {args.year}: {population:,.0f}")
 
-        ukraine_data = find_ukraine_population_data(csv_data)
-        print(f"\nFound {len(ukraine_data)} data points for Ukraine (1991-2019):")
-        for record in ukraine_data:
-            print(f"Year: {record['Year']}, Population: {record['Population']:,.0f}")
 
-        min_max = find_min_max_values(ukraine_data)
-        print("\n" + "=" * 60)
-        print("RESULTS:")
-        print("=" * 60)
+def run_group_report(args: argparse.Namespace) -> None:
+    if args.workers:
+        groups = aggregate_population_parallel(
+            args.input, args.workers, args.start_year, args.end_year
+        )
+    elif args.cache:
+        columns = load_population_columns(args.input)
+        try:
+            groups = aggregate_population_points(
+                columns.iter_points(), args.start_year, args.end_year
+            )
+        finally:
+            columns.close()
+    else:
+        groups = aggregate_population_groups(
+            iter_csv_rows(args.input), args.start_year, args.end_year
+        )
+    if not groups:
+        years = "-".join(
+            "any" if year is None else str(year)
+            for year in (args.start_year, args.end_year)
+        )
+        print(f"No data points ({years}).")
+        return
+
+    print(f"\nAggregated {len(groups)} (country, indicator) groups:")
+    for (country, indicator), group in groups.items():
         print(
-            f"Minimum Population: {min_max['min']['Population']:,.0f} in {min_max['min']['Year']}"
+            f"{country} | {indicator}: {group['Count']} years, "
+            f"min {group['Min'][1]:,.0f} ({group['Min'][0]}), "
+            f"max {group['Max'][1]:,.0f} ({group['Max'][0]})"
+        )
+    write_results_to_csv(None, args.output or GROUPS_OUTPUT_FILENAME, groups)
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Process World Bank population data")
+    parser.add_argument("--input", default="population_data.csv")
+    parser.add_argument("--output", help="results CSV file")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="read rows lazily without loading the file; for very large files "
+        "(head preview only)",
+    )
+    parser.add_argument(
+        "--all-groups",
+        action="store_true",
+        help="report every (country, indicator) group in one pass",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="with --all-groups, parse the file in this many processes",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="with --stream or --all-groups, reuse a memory-mapped columnar "
+        "copy of the parsed file (rebuilt when the file changes)",
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        help="print the value for one year through a byte-offset index "
+        "kept next to the input file",
+    )
+    parser.add_argument(
+        "--display",
+        choices=DISPLAY_MODES,
+        default="head",
+        help="which rows of the file to show (default head)",
+    )
+    parser.add_argument(
+        "--limit",
+        type=non_negative_int,
+        default=DISPLAY_LIMIT,
+        help=f"number of rows to show (default {DISPLAY_LIMIT}, 0 for all)",
+    )
+    parser.add_argument("--country", default="Ukraine")
+    parser.add_argument("--indicator", default="Population, total")
+    parser.add_argument(
+        "--start-year",
+        type=int,
+        help="first year (default 1991; all years with --all-groups)",
+    )
+    parser.add_argument(
+        "--end-year",
+        type=int,
+        help="last year (default 2019; all years with --all-groups)",
+    )
+    args = parser.parse_args()
+    if args.cache and args.workers:
+        parser.error("--cache cannot be combined with --workers")
+    if args.stream and (args.display != "head" or not args.limit):
+        # Anything but a bounded head would load the file or read it twice.
+        parser.error("--stream previews only a head with --limit above 0")
+
+    try:
+        if args.year is not None:
+            run_point_lookup(args)
+            return
+        if args.all_groups:
+            run_group_report(args)
+            return
+        # The year defaults belong to the single-country query only.
+        args.start_year = 1991 if args.start_year is None else args.start_year
+        args.end_year = 2019 if args.end_year is None else args.end_year
+        args.output = args.output or OUTPUT_FILENAME
+        if args.stream:
+            run_streaming_pipeline(args)
+            return
+
+        if args.display == "head":
+            # The head is shown before the whole file is read.
+            preview_csv_file(args.input, args.display, args.limit or None)
+        csv_data = read_csv_file(args.input)
+        if args.display != "head":
+            display_csv_content(csv_data, args.display, args.limit or None)
+
+        ukraine_data = find_ukraine_population_data(
+            csv_data, args.indicator, args.country, args.start_year, args.end_year
         )
         print(
-            f"Maximum Population: {min_max['max']['Population']:,.0f} in {min_max['max']['Year']}"
+            f"\nFound {len(ukraine_data)} data points for {args.country} "
+            f"({args.start_year}-{args.end_year}):"
         )
-        print("=" * 60)
+        for record in ukraine_data:
+            print(f"Year: {record['Year']}, Population: {record['Population']:,.0f}")
+
+        min_max = find_min_max_values(ukraine_data)
+        print_min_max(min_max)
 
-        write_results_to_csv(min_max, output_filename)
+        write_results_to_csv(min_max, args.output)
 
     except OSError as e:
         print(f"Error: {e}")
@@ -1,5 +1,16 @@
+import argparse
 import json
-from typing import List, Dict, Any
+from bisect import bisect_left, bisect_right, insort_right
+from heapq import merge
+from typing import List, Dict, Any, Optional
+
+from height_totals import HeightTotals
+from students_journal import (
+    DEFAULT_COMPACT_EVERY,
+    DEFAULT_SYNC_EVERY,
+    StudentsJournal,
+)
+from students_search_index import StudentsSearchIndex
 
 
 def read_json_file(filename: str) -> List[Dict[str, Any]]:
@@ -20,115 +31,254 @@ def display_json_content(data: List[Dict[str, Any]]) -> None:
     print(json.dumps(data, indent=2, ensure_ascii=False))
 
 
-def add_student(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def read_new_student() -> Optional[Dict[str, Any]]:
     name = input("Enter student name: ").strip()
     if not name:
-        return data
+        return None
 
     gender = input("Enter gender (male/female): ").strip().lower()
     if gender not in ["male", "female"]:
-        return data
+        return None
 
     try:
         height = float(input("Enter height (cm): "))
         if height <= 0:
-            return data
+            return None
     except ValueError:
-        return data
+        return None
 
-    data.append({"name": name, "gender": gender, "height": height})
-    data.sort(key=lambda x: x["height"], reverse=True)
+    return {"name": name, "gender": gender, "height": height}
+
+
+def height_key(student: Dict[str, Any]) -> float:
+    return -student["height"]
+
+
+def insert_student(data: List[Dict[str, Any]], student: Dict[str, Any]) -> None:
+    # data is sorted tallest first; equal heights keep insertion order.
+    insort_right(data, student, key=height_key)
+
+
+def add_student(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    student = read_new_student()
+    if student is not None:
+        insert_student(data, student)
     return data
 
 
-def remove_student(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    for i, student in enumerate(data, 1):
-        print(f"{i}. {student['name']} ({student['gender']}) - {student['height']} cm")
+def parse_student(record: Any) -> Optional[Dict[str, Any]]:
+    # Same checks as read_new_student, for records read from a file.
+    if not isinstance(record, dict):
+        return None
+    name = str(record.get("name", "")).strip()
+    gender = str(record.get("gender", "")).strip().lower()
+    try:
+        height = float(record.get("height"))
+    except (TypeError, ValueError):
+        return None
+    if not name or gender not in ["male", "female"] or not height > 0:
+        return None
+    return {"name": name, "gender": gender, "height": height}
+
+
+def read_students_file(filename: str) -> List[Dict[str, Any]]:
+    students = [parse_student(record) for record in read_json_file(filename)]
+    return [student for student in students if student is not None]
+
+
+def merge_students(data: List[Dict[str, Any]], batch: List[Dict[str, Any]]) -> None:
+    # Sorts only the batch, then merges it in one pass: O(n + k log k).
+    # heapq.merge is stable, so the result equals inserting the batch
+    # one student at a time.
+    batch = sorted(batch, key=height_key)
+    data[:] = merge(data, batch, key=height_key)
 
+
+def find_student(
+    data: List[Dict[str, Any]], name: str, height: Optional[float] = None
+) -> Optional[int]:
+    # With a height, only the students of that height are compared.
+    start, end = 0, len(data)
+    if height is not None:
+        start = bisect_left(data, -height, key=height_key)
+        end = bisect_right(data, -height, lo=start, key=height_key)
+    for i in range(start, end):
+        if data[i]["name"] == name:
+            return i
+    return None
+
+
+def choose_student(data: List[Dict[str, Any]]) -> Optional[int]:
+    name = input("Enter student name to remove: ").strip()
+    height_text = input("Enter height (cm), or leave empty: ").strip()
     try:
-        index = int(input("Enter student number to remove: ")) - 1
-        if 0 <= index < len(data):
-            data.pop(index)
-    except (ValueError, IndexError):
-        pass
+        height = float(height_text) if height_text else None
+    except ValueError:
+        return None
+    return find_student(data, name, height)
 
+
+def remove_student(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    index = choose_student(data)
+    if index is not None:
+        data.pop(index)
     return data
 
 
-def search_students(data: List[Dict[str, Any]]) -> None:
+def search_students(
+    data: List[Dict[str, Any]], index: Optional[StudentsSearchIndex] = None
+) -> None:
     print("1. Name 2. Gender 3. Height (exact) 4. Height (range)")
     choice = input("Enter choice: ").strip()
     results = []
 
     if choice == "1":
         search_term = input("Enter name: ").strip().lower()
-        results = [s for s in data if search_term in s["name"].lower()]
+        if index is not None:
+            results = index.by_name(search_term)
+        else:
+            results = [s for s in data if search_term in s["name"].lower()]
 
     elif choice == "2":
         gender = input("Enter gender (male/female): ").strip().lower()
         if gender in ["male", "female"]:
-            results = [s for s in data if s["gender"] == gender]
+            if index is not None:
+                results = index.by_gender(gender)
+            else:
+                results = [s for s in data if s["gender"] == gender]
 
     elif choice == "3":
         try:
             height = float(input("Enter height: "))
-            results = [s for s in data if s["height"] == height]
         except ValueError:
             return
+        if index is not None:
+            results = index.by_height(height)
+        else:
+            results = [s for s in data if s["height"] == height]
 
     elif choice == "4":
         try:
             min_height = float(input("Min height: "))
             max_height = float(input("Max height: "))
-            results = [s for s in data if min_height <= s["height"] <= max_height]
         except ValueError:
             return
+        if index is not None:
+            results = index.by_height_range(min_height, max_height)
+        else:
+            results = [s for s in data if min_height <= s["height"] <= max_height]
 
     for student in results:
         print(f"{student['name']} ({student['gender']}) - {student['height']} cm")
 
 
 def calculate_height_comparison(data: List[Dict[str, Any]]) -> Dict[str, Any]:
-    girls_height = sum(s["height"] for s in data if s["gender"] == "female")
-    boys_height = sum(s["height"] for s in data if s["gender"] == "male")
-
-    return {
-        "total_girls_height": girls_height,
-        "total_boys_height": boys_height,
-        "girls_exceed_boys": girls_height > boys_height,
-        "difference": abs(girls_height - boys_height),
-        "girls_count": sum(1 for s in data if s["gender"] == "female"),
-        "boys_count": sum(1 for s in data if s["gender"] == "male"),
-    }
+    return HeightTotals(data).comparison()
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Students height processor")
+    parser.add_argument(
+        "--journal",
+        action="store_true",
+        help="log adds and removes to students_data.json.log instead of "
+        "rewriting students_data.json after every change",
+    )
+    parser.add_argument(
+        "--compact-every",
+        type=int,
+        default=DEFAULT_COMPACT_EVERY,
+        help="with --journal, rewrite students_data.json after this many changes",
+    )
+    parser.add_argument(
+        "--sync-every",
+        type=int,
+        default=DEFAULT_SYNC_EVERY,
+        help="with --journal, fsync the log once per this many changes",
+    )
+    args = parser.parse_args()
+
     filename = "students_data.json"
     result_filename = "height_comparison_result.json"
-    data = read_json_file(filename)
-
-    while True:
-        print("\n1. Display 2. Add 3. Remove 4. Search 5. Calculate 6. Exit")
-        choice = input("Choice: ").strip()
-
-        if choice == "1":
-            display_json_content(data)
-        elif choice == "2":
-            data = add_student(data)
-            write_json_file(filename, data)
-        elif choice == "3":
-            data = remove_student(data)
-            write_json_file(filename, data)
-        elif choice == "4":
-            search_students(data)
-        elif choice == "5":
-            result = calculate_height_comparison(data)
-            print(f"Girls: {result['total_girls_height']:.2f} cm")
-            print(f"Boys: {result['total_boys_height']:.2f} cm")
-            print(f"Girls exceed: {'Yes' if result['girls_exceed_boys'] else 'No'}")
-            write_json_file(result_filename, [result])
-        elif choice == "6":
-            break
+    journal = None
+    if args.journal:
+        journal = StudentsJournal(filename, args.compact_every, args.sync_every)
+        data = journal.load()
+    else:
+        data = read_json_file(filename)
+    # The index answers in list order, tallest first.
+    data.sort(key=lambda x: x["height"], reverse=True)
+    # Built on the first search, so sessions that never search skip it.
+    index: Optional[StudentsSearchIndex] = None
+    totals = HeightTotals(data)
+    written_result = read_json_file(result_filename)
+
+    try:
+        while True:
+            print(
+                "\n1. Display 2. Add 3. Remove 4. Search 5. Calculate 6. Exit "
+                "7. Add from file"
+            )
+            choice = input("Choice: ").strip()
+
+            if choice == "1":
+                display_json_content(data)
+            elif choice == "2":
+                student = read_new_student()
+                if student is not None:
+                    insert_student(data, student)
+                    if index is not None:
+                        index.add(student)
+                    totals.add(student)
+                    if journal:
+                        journal.add(data, student)
+                    else:
+                        write_json_file(filename, data)
+            elif choice == "3":
+                number = choose_student(data)
+                if number is None:
+                    print("Student not found.")
+                else:
+                    student = data.pop(number)
+                    if index is not None:
+                        index.remove(student)
+                    totals.remove(student)
+                    if journal:
+                        journal.remove(data, student)
+                    else:
+                        write_json_file(filename, data)
+            elif choice == "4":
+                if index is None:
+                    index = StudentsSearchIndex(data)
+                search_students(data, index)
+            elif choice == "5":
+                result = totals.comparison()
+                print(f"Girls: {result['total_girls_height']:.2f} cm")
+                print(f"Boys: {result['total_boys_height']:.2f} cm")
+                print(f"Girls exceed: {'Yes' if result['girls_exceed_boys'] else 'No'}")
+                if written_result != [result]:
+                    write_json_file(result_filename, [result])
+                    written_result = [result]
+            elif choice == "6":
+                break
+            elif choice == "7":
+                batch = read_students_file(input("Enter students file: ").strip())
+                if batch:
+                    merge_students(data, batch)
+                    if index is not None:
+                        index.extend(batch)
+                    totals.extend(batch)
+                    if journal:
+                        # The merge already rewrote the list in O(n), so
+                        # fold it into the snapshot at once rather than
+                        # logging students a compaction could duplicate.
+                        journal.compact(data)
+                    else:
+                        write_json_file(filename, data)
+                print(f"Added {len(batch)} students.")
+    finally:
+        if journal:
+            journal.close(data)
 
 
 if __name__ == "__main__":
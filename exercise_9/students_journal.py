@@ -0,0 +1,161 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+DEFAULT_COMPACT_EVERY = 1000
+DEFAULT_SYNC_EVERY = 32
+
+
+class StudentsJournal:
+    """
+    Delta journal for the students list of students_height_processor.
+
+    Every add or remove is appended to ``<snapshot>.log`` as one JSON
+    line, so a mutation costs O(1) I/O instead of rewriting the whole
+    list. The log is flushed after every line and fsynced once per
+    ``sync_every`` lines. After ``compact_every`` lines the list is
+    written to a temporary file and renamed over the snapshot, and the
+    log starts over.
+
+    The first line of the log names the digest of the snapshot it
+    applies to. A crash between the snapshot rename and the new log
+    leaves a log for the old digest, which is then ignored instead of
+    being replayed twice. A torn last line is ignored too.
+
+    Args:
+        snapshot_path: path to students_data.json
+        compact_every: number of logged mutations that triggers compaction
+        sync_every: number of logged mutations per fsync
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+        sync_every: int = DEFAULT_SYNC_EVERY,
+    ) -> None:
+        self.snapshot_path = snapshot_path
+        self.log_path = snapshot_path + ".log"
+        self.compact_every = compact_every
+        self.sync_every = sync_every
+        self._log = None
+        self._logged = 0
+        self._unsynced = 0
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Read the snapshot, replay the log and start journaling."""
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            raw = None
+        data: List[Dict[str, Any]] = []
+        if raw is not None:
+            try:
+                loaded = json.loads(raw)
+                data = loaded if isinstance(loaded, list) else []
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                data = []
+        digest = self._digest(raw)
+
+        if self._replay(digest, data):
+            # Fold the replayed log in now; this also drops a torn last
+            # line that new entries would otherwise be appended to.
+            data.sort(key=lambda x: x["height"], reverse=True)
+            self.compact(data)
+        else:
+            self._start_log(digest)
+        return data
+
+    def add(self, data: List[Dict[str, Any]], student: Dict[str, Any]) -> None:
+        """Log a student that was added to data."""
+        self._append({"op": "add", "student": student}, data)
+
+    def remove(self, data: List[Dict[str, Any]], student: Dict[str, Any]) -> None:
+        """Log a student that was removed from data."""
+        self._append({"op": "remove", "student": student}, data)
+
+    def compact(self, data: List[Dict[str, Any]]) -> None:
+        """Write data to the snapshot with an atomic rename and reset the log."""
+        raw = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self._start_log(self._digest(raw))
+        self._logged = 0
+
+    def close(self, data: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Fsync the log, and compact it first when data is given."""
+        if self._log is None:
+            return
+        if data is not None and self._logged:
+            self.compact(data)
+        self._sync()
+        self._log.close()
+        self._log = None
+
+    def _append(self, entry: Dict[str, Any], data: List[Dict[str, Any]]) -> None:
+        self._log.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._log.flush()
+        self._logged += 1
+        self._unsynced += 1
+        if self._logged >= self.compact_every:
+            self.compact(data)
+        elif self._unsynced >= self.sync_every:
+            self._sync()
+
+    def _sync(self) -> None:
+        if self._unsynced:
+            os.fsync(self._log.fileno())
+            self._unsynced = 0
+
+    def _start_log(self, digest: Optional[str]) -> None:
+        if self._log is not None:
+            self._log.close()
+        tmp_path = self.log_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"snapshot": digest}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.log_path)
+        self._log = open(self.log_path, "a", encoding="utf-8")
+        self._unsynced = 0
+
+    def _replay(self, digest: Optional[str], data: List[Dict[str, Any]]) -> int:
+        # Applies the logged mutations in order; the caller restores the
+        # height order once at the end, which gives the same list as
+        # sorting after every add because the sort is stable.
+        if not os.path.exists(self.log_path):
+            return 0
+        applied = 0
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            try:
+                header = json.loads(f.readline())
+            except json.JSONDecodeError:
+                return 0
+            if not isinstance(header, dict) or header.get("snapshot") != digest:
+                # The log belongs to an older snapshot that already has it.
+                return 0
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line after a crash.
+                    break
+                if entry["op"] == "add":
+                    data.append(entry["student"])
+                elif entry["op"] == "remove":
+                    try:
+                        data.remove(entry["student"])
+                    except ValueError:
+                        pass
+                applied += 1
+        return applied
+
+    @staticmethod
+    def _digest(raw: Optional[bytes]) -> Optional[str]:
+        return None if raw is None else hashlib.sha1(raw).hexdigest()
@@ -0,0 +1,149 @@
+from bisect import bisect_left, insort
+from math import inf
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+GRAM = 3
+
+# (-height, insertion number): sorting by it gives the order of the
+# students list, tallest first and equal heights in insertion order.
+Key = Tuple[float, int]
+
+
+def name_grams(name: str) -> Set[str]:
+    return {name[i : i + GRAM] for i in range(len(name) - GRAM + 1)}
+
+
+class StudentsSearchIndex:
+    """
+    Search index kept alongside the students list of
+    students_height_processor.
+
+    Students are kept in sorted (-height, insertion number) key lists,
+    one for everybody and one per gender, so a gender filter returns a
+    ready partition and exact height and range queries are two bisects.
+    Lowercased names are indexed by trigrams: a substring query of three
+    or more characters intersects the posting sets of its trigrams and
+    checks only the surviving candidates. Shorter queries take the union
+    of the postings of the trigrams that contain them. Results come back
+    in the order of the students list, tallest first.
+
+    Args:
+        data: students to index, in list order
+    """
+
+    def __init__(self, data: Iterable[Dict[str, Any]] = ()) -> None:
+        self._keys: List[Key] = []
+        self._partitions: Dict[str, List[Key]] = {}
+        self._students: Dict[int, Dict[str, Any]] = {}
+        self._names: Dict[int, str] = {}
+        self._numbers: Dict[int, int] = {}  # id(student) -> insertion number
+        self._grams: Dict[str, Set[int]] = {}
+        self._short: Dict[int, str] = {}  # names shorter than GRAM
+        self._next = 0
+
+        for student in data:
+            self._index(student)
+        self._keys.sort()
+        for keys in self._partitions.values():
+            keys.sort()
+
+    def __len__(self) -> int:
+        return len(self._students)
+
+    def _index(self, student: Dict[str, Any]) -> Key:
+        number = self._next
+        self._next += 1
+        key = (-student["height"], number)
+        name = student["name"].lower()
+
+        self._students[number] = student
+        self._names[number] = name
+        self._numbers[id(student)] = number
+        if len(name) < GRAM:
+            self._short[number] = name
+        for gram in name_grams(name):
+            self._grams.setdefault(gram, set()).add(number)
+
+        self._keys.append(key)
+        self._partitions.setdefault(student["gender"], []).append(key)
+        return key
+
+    def add(self, student: Dict[str, Any]) -> None:
+        """Index a student appended to the list."""
+        key = self._index(student)
+        # _index appended the key; move it to its sorted place.
+        self._keys.pop()
+        insort(self._keys, key)
+        partition = self._partitions[student["gender"]]
+        partition.pop()
+        insort(partition, key)
+
+    def extend(self, students: Iterable[Dict[str, Any]]) -> None:
+        """Index a batch of students merged into the list."""
+        for student in students:
+            self._index(student)
+        # Timsort keeps the existing keys as one sorted run, so this is
+        # about O(n + k log k) rather than a full re-sort.
+        self._keys.sort()
+        for keys in self._partitions.values():
+            keys.sort()
+
+    def remove(self, student: Dict[str, Any]) -> None:
+        """Drop a student removed from the list (matched by identity)."""
+        number = self._numbers.pop(id(student))
+        key = (-student["height"], number)
+        del self._students[number]
+        name = self._names.pop(number)
+        self._short.pop(number, None)
+        for gram in name_grams(name):
+            postings = self._grams[gram]
+            postings.discard(number)
+            if not postings:
+                del self._grams[gram]
+
+        for keys in (self._keys, self._partitions[student["gender"]]):
+            del keys[bisect_left(keys, key)]
+
+    def _in_order(self, numbers: Iterable[int]) -> List[Dict[str, Any]]:
+        students = self._students
+        keys = sorted((-students[n]["height"], n) for n in numbers)
+        return [students[n] for _, n in keys]
+
+    def _slice(self, keys: List[Key], low: float, high: float) -> List[Dict[str, Any]]:
+        start = bisect_left(keys, (-high, -1))
+        end = bisect_left(keys, (-low, inf))
+        students = self._students
+        return [students[n] for _, n in keys[start:end]]
+
+    def by_name(self, term: str) -> List[Dict[str, Any]]:
+        """Students whose name contains term, ignoring case."""
+        term = term.lower()
+        if not term:
+            return self._slice(self._keys, -inf, inf)
+        if len(term) >= GRAM:
+            postings = sorted(
+                (self._grams.get(gram, set()) for gram in name_grams(term)), key=len
+            )
+            candidates = set(postings[0]).intersection(*postings[1:])
+        else:
+            candidates = set()
+            for gram, numbers in self._grams.items():
+                if term in gram:
+                    candidates |= numbers
+            candidates.update(n for n, name in self._short.items() if term in name)
+        names = self._names
+        return self._in_order(n for n in candidates if term in names[n])
+
+    def by_gender(self, gender: str) -> List[Dict[str, Any]]:
+        keys = self._partitions.get(gender, [])
+        students = self._students
+        return [students[n] for _, n in keys]
+
+    def by_height(self, height: float) -> List[Dict[str, Any]]:
+        return self._slice(self._keys, height, height)
+
+    def by_height_range(self, low: float, high: float) -> List[Dict[str, Any]]:
+        """Students with low <= height <= high."""
+        if high < low:
+            return []
+        return self._slice(self._keys, low, high)